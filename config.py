@@ -1,14 +1,36 @@
 """
 Global configuration for the Video Splitter application.
 Contains settings for AI services, audio processing, and caching.
+
+RuntimeConfig (exposed as ``config``) holds the persisted, user-editable
+settings; Config holds the static application constants and paths.
 """
 
+import copy
+import functools
+import hashlib
 import os
+import shutil
+import time
 from pathlib import Path
 from typing import Dict, Any
-import json
 import logging
 
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 logger = logging.getLogger(__name__)
 
 # Default Paths
@@ -61,7 +83,96 @@ DEFAULT_CONFIG = {
     }
 }
 
-class Config:
+# Keyboard Shortcuts
+DEFAULT_SHORTCUTS = {
+    "play_pause": "Space",
+    "mark_in": "I",
+    "mark_out": "O",
+    "seek_forward": "Right",
+    "seek_backward": "Left",
+    "seek_forward_small": "Up",
+    "seek_backward_small": "Down",
+    "next_frame": "]",
+    "prev_frame": "[",
+    "delete_part": "Delete",
+    "undo": "Ctrl+Z",
+    "redo": "Ctrl+Y",
+    "save": "Ctrl+S",
+    "open": "Ctrl+O",
+    "new": "Ctrl+N",
+    "export": "Ctrl+E",
+    "split_at_cursor": "S",
+    "add_part": "A"
+}
+
+# Themes
+DARK_THEME = {
+    "name": "Dark",
+    "bg_primary": "#0f0f0f",
+    "bg_secondary": "#1a1a1a",
+    "bg_tertiary": "#222222",
+    "bg_elevated": "#2d2d2d",
+    "text_primary": "#ffffff",
+    "text_secondary": "#999999",
+    "text_tertiary": "#666666",
+    "accent": "#00d9ff",
+    "accent_hover": "#00b8d4",
+    "success": "#00c853",
+    "warning": "#ffc107",
+    "error": "#ff5252",
+    "border": "rgba(255, 255, 255, 0.08)",
+    "shadow": "rgba(0, 0, 0, 0.5)"
+}
+
+# Export Presets
+EXPORT_PRESETS = {
+    "Conference Talk": {
+        "audio_channels": "mono",
+        "audio_bitrate": "96k",
+        "naming": "{basename}_talk{part_number:02d}",
+        "description": "Optimized for speech content"
+    },
+    "Music/Concert": {
+        "audio_channels": "stereo",
+        "audio_bitrate": "320k",
+        "naming": "{basename}_track{part_number:02d}",
+        "description": "High-quality stereo audio"
+    },
+    "Podcast": {
+        "audio_channels": "mono",
+        "audio_bitrate": "128k",
+        "naming": "{basename}_ep{part_number:02d}",
+        "description": "Podcast episode format"
+    },
+    "Interview": {
+        "audio_channels": "mono",
+        "audio_bitrate": "128k",
+        "naming": "{basename}_q{part_number:02d}",
+        "description": "Interview Q&A format"
+    },
+    "Tutorial": {
+        "audio_channels": "stereo",
+        "audio_bitrate": "192k",
+        "naming": "{basename}_lesson{part_number:02d}",
+        "description": "Tutorial series format"
+    }
+}
+
+
+def _digest(data: bytes) -> bytes:
+    """Short content hash used to skip redundant config writes."""
+    return hashlib.blake2b(data, digest_size=8).digest()
+
+
+def _atomic_write(path, data: bytes):
+    """Write via a temp file in the same directory and os.replace it in."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class RuntimeConfig:
     """Global configuration manager."""
     
     _instance = None
@@ -74,17 +185,24 @@ class Config:
     
     def _initialize(self):
         """Initialize the configuration system."""
-        self._config = DEFAULT_CONFIG.copy()
+        self._config = copy.deepcopy(DEFAULT_CONFIG)
+        self._hash = None
         
         # Create config directory if it doesn't exist
         os.makedirs(APP_CONFIG_DIR, exist_ok=True)
         
         # Load existing config if available
-        if os.path.exists(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raw = None
+        
+        if raw is not None:
+            self._hash = _digest(raw)
             try:
-                with open(CONFIG_FILE, 'r') as f:
-                    stored_config = json.load(f)
-                    self._update_recursive(self._config, stored_config)
+                stored_config = _loads(raw)
+                self._update_recursive(self._config, stored_config)
             except Exception as e:
                 logger.error(f"Failed to load config: {e}")
         
@@ -96,7 +214,7 @@ class Config:
         os.makedirs(CACHE_DIR, exist_ok=True)
         os.makedirs(self._config["export"]["temp_directory"], exist_ok=True)
         
-        # Save config to ensure all defaults are written
+        # Save config to ensure all defaults are written (no-op if unchanged)
         self.save()
     
     def _update_recursive(self, base: Dict[str, Any], update: Dict[str, Any]):
@@ -121,15 +239,19 @@ class Config:
         self.save()
     
     def save(self):
-        """Save the current configuration to disk."""
+        """Save the current configuration to disk if it changed."""
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            data = _dumps(self._config)
+            new_hash = _digest(data)
+            if new_hash == self._hash:
+                return
+            _atomic_write(CONFIG_FILE, data)
+            self._hash = new_hash
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
 
 # Global configuration instance
-config = Config()
+config = RuntimeConfig()
 
 class Config:
     """Application configuration manager"""
@@ -182,90 +304,28 @@ class Config:
     DEFAULT_AUDIO_CODEC = "libmp3lame"
     DEFAULT_AUDIO_BITRATE = "192k"
     
-    # Keyboard Shortcuts
-    DEFAULT_SHORTCUTS = {
-        "play_pause": "Space",
-        "mark_in": "I",
-        "mark_out": "O",
-        "seek_forward": "Right",
-        "seek_backward": "Left",
-        "seek_forward_small": "Up",
-        "seek_backward_small": "Down",
-        "next_frame": "]",
-        "prev_frame": "[",
-        "delete_part": "Delete",
-        "undo": "Ctrl+Z",
-        "redo": "Ctrl+Y",
-        "save": "Ctrl+S",
-        "open": "Ctrl+O",
-        "new": "Ctrl+N",
-        "export": "Ctrl+E",
-        "split_at_cursor": "S",
-        "add_part": "A"
-    }
-    
-    # Themes
-    DARK_THEME = {
-        "name": "Dark",
-        "bg_primary": "#0f0f0f",
-        "bg_secondary": "#1a1a1a",
-        "bg_tertiary": "#222222",
-        "bg_elevated": "#2d2d2d",
-        "text_primary": "#ffffff",
-        "text_secondary": "#999999",
-        "text_tertiary": "#666666",
-        "accent": "#00d9ff",
-        "accent_hover": "#00b8d4",
-        "success": "#00c853",
-        "warning": "#ffc107",
-        "error": "#ff5252",
-        "border": "rgba(255, 255, 255, 0.08)",
-        "shadow": "rgba(0, 0, 0, 0.5)"
-    }
-    
-    # Export Presets
-    EXPORT_PRESETS = {
-        "Conference Talk": {
-            "audio_channels": "mono",
-            "audio_bitrate": "96k",
-            "naming": "{basename}_talk{part_number:02d}",
-            "description": "Optimized for speech content"
-        },
-        "Music/Concert": {
-            "audio_channels": "stereo",
-            "audio_bitrate": "320k",
-            "naming": "{basename}_track{part_number:02d}",
-            "description": "High-quality stereo audio"
-        },
-        "Podcast": {
-            "audio_channels": "mono",
-            "audio_bitrate": "128k",
-            "naming": "{basename}_ep{part_number:02d}",
-            "description": "Podcast episode format"
-        },
-        "Interview": {
-            "audio_channels": "mono",
-            "audio_bitrate": "128k",
-            "naming": "{basename}_q{part_number:02d}",
-            "description": "Interview Q&A format"
-        },
-        "Tutorial": {
-            "audio_channels": "stereo",
-            "audio_bitrate": "192k",
-            "naming": "{basename}_lesson{part_number:02d}",
-            "description": "Tutorial series format"
-        }
-    }
+    # Keyboard Shortcuts, themes and presets (module-level constants)
+    DEFAULT_SHORTCUTS = DEFAULT_SHORTCUTS
+    DARK_THEME = DARK_THEME
+    EXPORT_PRESETS = EXPORT_PRESETS
     
     # Validation Rules
-    SUPPORTED_VIDEO_FORMATS = [
-        ".mp4", ".avi", ".mov", ".mkv", ".webm", 
+    SUPPORTED_VIDEO_FORMATS = frozenset({
+        ".mp4", ".avi", ".mov", ".mkv", ".webm",
         ".flv", ".wmv", ".m4v", ".mpg", ".mpeg", ".3gp"
-    ]
+    })
     
-    SUPPORTED_AUDIO_FORMATS = [
+    SUPPORTED_AUDIO_FORMATS = frozenset({
         ".mp3", ".wav", ".aac", ".m4a", ".ogg", ".flac", ".wma"
-    ]
+    })
+    
+    # Same extensions accepted with or without the leading dot
+    SUPPORTED_VIDEO_EXTS = SUPPORTED_VIDEO_FORMATS | frozenset(
+        ext.lstrip(".") for ext in SUPPORTED_VIDEO_FORMATS
+    )
+    SUPPORTED_AUDIO_EXTS = SUPPORTED_AUDIO_FORMATS | frozenset(
+        ext.lstrip(".") for ext in SUPPORTED_AUDIO_FORMATS
+    )
     
     # Feature Flags
     ENABLE_SCENE_DETECTION = True
@@ -276,21 +336,25 @@ class Config:
     ENABLE_CLOUD_SYNC = False
     ENABLE_ANALYTICS = False
     
+    # Digest of settings.json as last read or written
+    _settings_hash = None
+    
     @classmethod
     def ensure_directories(cls):
         """Create necessary directories"""
-        for dir_path in [cls.CONFIG_DIR, cls.CACHE_DIR, cls.LOGS_DIR, 
-                        cls.PRESETS_DIR, cls.TEMP_DIR]:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        _ensure_dirs_once()
     
     @classmethod
     def load_user_settings(cls) -> Dict[str, Any]:
         """Load user settings from file"""
+        _ensure_dirs_once()
         settings_file = cls.CONFIG_DIR / "settings.json"
         if settings_file.exists():
             try:
-                with open(settings_file, 'r') as f:
-                    return json.load(f)
+                with open(settings_file, 'rb') as f:
+                    raw = f.read()
+                cls._settings_hash = _digest(raw)
+                return _loads(raw)
             except:
                 return {}
         return {}
@@ -298,59 +362,118 @@ class Config:
     @classmethod
     def save_user_settings(cls, settings: Dict[str, Any]):
         """Save user settings to file"""
+        _ensure_dirs_once()
         settings_file = cls.CONFIG_DIR / "settings.json"
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            data = _dumps(settings)
+            new_hash = _digest(data)
+            if new_hash == cls._settings_hash:
+                return
+            _atomic_write(settings_file, data)
+            cls._settings_hash = new_hash
         except Exception as e:
             print(f"Failed to save settings: {e}")
     
     @classmethod
     def get_ffmpeg_path(cls) -> str:
         """Get FFmpeg executable path"""
-        # Try system PATH first
-        import shutil
-        ffmpeg = shutil.which("ffmpeg")
-        if ffmpeg:
-            return ffmpeg
-        
-        # Try common installation paths
-        common_paths = [
-            "/usr/bin/ffmpeg",
-            "/usr/local/bin/ffmpeg",
-            "C:\\ffmpeg\\bin\\ffmpeg.exe",
-            "C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe"
-        ]
-        
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-        
-        raise FileNotFoundError("FFmpeg not found. Please install FFmpeg and add it to PATH.")
+        return _resolve_ffmpeg()
     
     @classmethod
     def clear_cache(cls):
         """Clear cached data"""
-        import shutil
-        if cls.CACHE_DIR.exists():
+        _ensure_dirs_once()
+        try:
             shutil.rmtree(cls.CACHE_DIR)
-            cls.CACHE_DIR.mkdir()
+        except FileNotFoundError:
+            pass
+        cls.CACHE_DIR.mkdir(exist_ok=True)
     
     @classmethod
     def clear_temp(cls):
         """Clear temporary files"""
-        import shutil
-        if cls.TEMP_DIR.exists():
+        _ensure_dirs_once()
+        try:
             shutil.rmtree(cls.TEMP_DIR)
-            cls.TEMP_DIR.mkdir()
+        except FileNotFoundError:
+            pass
+        cls.TEMP_DIR.mkdir(exist_ok=True)
     
     @classmethod
     def get_log_file(cls) -> Path:
         """Get current log file path"""
-        from datetime import datetime
-        date_str = datetime.now().strftime("%Y%m%d")
-        return cls.LOGS_DIR / f"app_{date_str}.log"
+        if time.time() < _LOG_FILE_CACHE[0]:
+            return _LOG_FILE_CACHE[1]
+        
+        from datetime import datetime, timedelta
+        _ensure_dirs_once()
+        now = datetime.now()
+        date_str = now.strftime("%Y%m%d")
+        next_midnight = datetime(now.year, now.month, now.day) + timedelta(days=1)
+        
+        _LOG_FILE_CACHE[0] = next_midnight.timestamp()
+        _LOG_FILE_CACHE[1] = cls.LOGS_DIR / f"app_{date_str}.log"
+        return _LOG_FILE_CACHE[1]
 
 
-# Initialize directories on import
-Config.ensure_directories()
\ No newline at end of file
+# Current log file path and the local midnight it is valid until
+_LOG_FILE_CACHE = [0.0, None]
+
+# Common FFmpeg installation paths checked when it is not on PATH
+_COMMON_FFMPEG_PATHS = (
+    "/usr/bin/ffmpeg",
+    "/usr/local/bin/ffmpeg",
+    "C:\\ffmpeg\\bin\\ffmpeg.exe",
+    "C:\\Program Files\\ffmpeg\\bin\\ffmpeg.exe"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_ffmpeg() -> str:
+    """Locate the FFmpeg executable once per process"""
+    # Try system PATH first
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg:
+        return ffmpeg
+    
+    # Try common installation paths
+    ffmpeg = next((p for p in _COMMON_FFMPEG_PATHS if os.path.isfile(p)), None)
+    if ffmpeg:
+        return ffmpeg
+    
+    raise FileNotFoundError("FFmpeg not found. Please install FFmpeg and add it to PATH.")
+
+
+# Set once the application directories have been created
+_DIRS_READY = False
+
+
+def _ensure_dirs_once():
+    """Create the application directories on first use.
+
+    Plans the unique set of directories (plus their missing ancestors below
+    the home directory) up front and creates them shallowest-first with a
+    plain ``os.mkdir``, so each directory costs a single syscall instead of
+    pathlib's recursive ``parents=True`` walk. Subsequent calls are no-ops.
+    """
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    
+    home = Path.home()
+    planned = set()
+    for dir_path in (Config.CONFIG_DIR, Config.CACHE_DIR, Config.LOGS_DIR,
+                     Config.PRESETS_DIR, Config.TEMP_DIR):
+        planned.add(dir_path)
+        planned.update(p for p in dir_path.parents if home in p.parents)
+    
+    for dir_path in sorted(planned, key=lambda p: len(p.parts)):
+        try:
+            os.mkdir(dir_path)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            # Ancestor outside the planned tree is missing
+            os.makedirs(dir_path, exist_ok=True)
+    
+    _DIRS_READY = True
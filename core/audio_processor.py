@@ -1,27 +1,267 @@
 """
 Advanced audio processing with Demucs for music removal
 """
+import functools
+import importlib.util
+import json
+import math
 import os
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from config import Config, config
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Loaded Demucs models keyed by (model name, device)
+_MODEL_CACHE: Dict[Tuple[str, str], Any] = {}
+
+
+# Audio operations that are a single FFmpeg filter: (template, defaults)
+_FFMPEG_FILTER_OPS = {
+    'normalize': (
+        'loudnorm=I={target_level}:TP=-1.5:LRA=11',
+        {'target_level': -16.0}
+    ),
+    'reduce_noise': (
+        'afftdn=nf={noise_reduction}',
+        {'noise_reduction': 10}
+    ),
+    'eq': (
+        "firequalizer=gain_entry='entry(100,{bass});entry(1000,{mid});"
+        "entry(10000,{treble})':wfunc=tukey",
+        {'bass': 0, 'mid': 0, 'treble': 0}
+    ),
+}
+
+# Fallbacks for FFmpeg builds missing a filter used above:
+# operation -> (required filter, template, defaults)
+_FALLBACK_FILTER_OPS = {
+    'eq': (
+        'firequalizer',
+        'equalizer=f=100:t=h:w=200:g={bass},'
+        'equalizer=f=1000:t=h:w=200:g={mid},'
+        'equalizer=f=10000:t=h:w=200:g={treble}',
+        {'bass': 0, 'mid': 0, 'treble': 0}
+    ),
+}
+
+
+# FFmpeg threads per job when clips are processed in parallel
+_BATCH_FFMPEG_THREADS = 2
+
+# Second loudnorm pass, fed with the first pass's measurements
+_LOUDNORM_APPLY = (
+    'loudnorm=I={target_level}:TP=-1.5:LRA=11'
+    ':measured_I={input_i}:measured_TP={input_tp}'
+    ':measured_LRA={input_lra}:measured_thresh={input_thresh}'
+    ':offset={target_offset}:linear=true'
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _build_filter(operation: str, fallback: bool = False, **params) -> str:
+    """
+    Build the FFmpeg audio filter string for an operation
+    
+    Cached so clips processed with identical parameters reuse the string.
+    """
+    if fallback:
+        _, template, defaults = _FALLBACK_FILTER_OPS[operation]
+    else:
+        template, defaults = _FFMPEG_FILTER_OPS[operation]
+    return template.format(**{**defaults, **params})
+
+
+@functools.lru_cache(maxsize=8)
+def _ffmpeg_filters(ffmpeg_path: str) -> frozenset:
+    """Names of the filters compiled into an FFmpeg build"""
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, '-hide_banner', '-filters'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=10
+        )
+    except Exception:
+        return frozenset()
+    
+    # Lines look like " TSC afftdn   A->A   Denoise audio samples..."
+    return frozenset(
+        parts[1] for parts in map(str.split, result.stdout.splitlines())
+        if len(parts) > 2 and '->' in parts[2]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _demucs_available() -> bool:
+    """Check if Demucs is installed without importing it (and torch)"""
+    return importlib.util.find_spec("demucs") is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_audio(file_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Probe the first audio stream of a file
+    
+    Cached on (path, mtime, size) so unchanged files are probed once.
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_entries',
+        'stream=codec_name,sample_rate,channels,channel_layout,bit_rate',
+        '-select_streams', 'a:0',
+        file_path
+    ]
+    
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        timeout=10
+    )
+    
+    data = _json_loads(result.stdout)
+    
+    if data.get('streams'):
+        stream = data['streams'][0]
+        return {
+            'codec': stream.get('codec_name'),
+            'sample_rate': stream.get('sample_rate'),
+            'channels': stream.get('channels'),
+            'channel_layout': stream.get('channel_layout'),
+            'bitrate': stream.get('bit_rate')
+        }
+    
+    return {}
+
+
+def _process_batch_job(job: Tuple[str, str, str, dict]) -> bool:
+    """Run one process_batch job in a worker process"""
+    video_path, output_path, operation, kwargs = job
+    processor = AudioProcessor(ffmpeg_threads=_BATCH_FFMPEG_THREADS)
+    return processor.process_video_audio(
+        video_path, output_path, operation, **kwargs
+    )
 
 
 class AudioProcessor:
     """Audio processing with Demucs and FFmpeg"""
     
-    def __init__(self):
-        self.demucs_available = self._check_demucs()
-        self.ffmpeg_path = 'ffmpeg'
+    def __init__(self, ffmpeg_threads: Optional[int] = None):
+        self.demucs_available = _demucs_available()
+        self.ffmpeg_threads = ffmpeg_threads
+        try:
+            self.ffmpeg_path = Config.get_ffmpeg_path()
+        except FileNotFoundError:
+            # Leave resolution to the OS so the error surfaces per operation
+            self.ffmpeg_path = 'ffmpeg'
     
-    def _check_demucs(self) -> bool:
-        """Check if Demucs is installed"""
+    @property
+    def _thread_args(self) -> list:
+        """FFmpeg output options capping its thread count, if set"""
+        if self.ffmpeg_threads:
+            return ['-threads', str(self.ffmpeg_threads)]
+        return []
+    
+    def _run_ffmpeg(self, cmd: list, explain_errors: bool = True):
+        """
+        Run an FFmpeg command whose output is not needed
+        
+        Output is discarded rather than buffered. On failure the command is
+        re-run once with stderr captured so the real error can be reported.
+        """
         try:
-            import demucs.separate
-            return True
-        except ImportError:
-            return False
+            subprocess.run(
+                cmd,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=Config.MAX_SUBPROCESS_TIMEOUT
+            )
+        except subprocess.CalledProcessError:
+            if not explain_errors:
+                raise
+            try:
+                subprocess.run(
+                    cmd,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=Config.MAX_SUBPROCESS_TIMEOUT
+                )
+            except subprocess.CalledProcessError as e:
+                details = e.stderr.decode(errors='replace').strip()
+                print(f"FFmpeg error: {details[-1000:]}")
+                raise
+    
+    def _filter_for(self, operation: str, **params) -> str:
+        """Filter string for an operation, using a fallback if needed"""
+        fallback = _FALLBACK_FILTER_OPS.get(operation)
+        use_fallback = (
+            fallback is not None
+            and fallback[0] not in _ffmpeg_filters(self.ffmpeg_path)
+        )
+        return _build_filter(operation, fallback=use_fallback, **params)
+    
+    def _load_demucs_model(self, model: str):
+        """Load a Demucs model, reusing it across calls"""
+        import torch
+        from demucs.pretrained import get_model
+        
+        device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        demucs_model = _MODEL_CACHE.get((model, device))
+        if demucs_model is None:
+            demucs_model = get_model(model)
+            demucs_model.to(device)
+            demucs_model.eval()
+            if device == 'cuda':
+                demucs_model.half()
+            _MODEL_CACHE[(model, device)] = demucs_model
+        
+        return demucs_model, device
+    
+    def _separate(self, demucs_model, device: str, wav, keep_vocals: bool):
+        """Run Demucs on a (channels, samples) tensor and pick the stems"""
+        import torch
+        from demucs.apply import apply_model
+        
+        # Normalize in place with scalar stats computed once
+        ref = wav.mean(0)
+        mean = ref.mean().item()
+        std = ref.std().item()
+        del ref
+        wav.sub_(mean).div_(std)
+        
+        mix = wav[None]
+        if device == 'cuda':
+            mix = mix.half()
+        
+        with torch.inference_mode():
+            sources = apply_model(
+                demucs_model,
+                mix,
+                device=device,
+                progress=True
+            )[0].float()
+        
+        sources.mul_(std).add_(mean)
+        
+        # Extract vocals or music
+        if keep_vocals:
+            return sources[3]  # vocals
+        # Combine everything except vocals
+        return sources[0] + sources[1] + sources[2]
     
     def remove_music(
         self,
@@ -48,15 +288,9 @@ class AudioProcessor:
             )
         
         try:
-            import torch
-            from demucs.pretrained import get_model
-            from demucs.apply import apply_model
             from demucs.audio import AudioFile, save_audio
             
-            # Load model
-            device = 'cuda' if torch.cuda.is_available() else 'cpu'
-            demucs_model = get_model(model)
-            demucs_model.to(device)
+            demucs_model, device = self._load_demucs_model(model)
             
             # Load audio
             wav = AudioFile(input_path).read(
@@ -65,27 +299,73 @@ class AudioProcessor:
                 channels=demucs_model.audio_channels
             )
             
-            # Separate sources
-            ref = wav.mean(0)
-            wav = (wav - ref.mean()) / ref.std()
+            output_audio = self._separate(demucs_model, device, wav, keep_vocals)
             
-            sources = apply_model(
-                demucs_model,
-                wav[None],
-                device=device,
-                progress=True
-            )[0]
+            # Save
+            save_audio(
+                output_audio,
+                output_path,
+                samplerate=demucs_model.samplerate
+            )
+            
+            return True
+            
+        except Exception as e:
+            print(f"Demucs error: {str(e)}")
+            return False
+    
+    def _remove_music_from_video(
+        self,
+        video_path: str,
+        output_path: str,
+        keep_vocals: bool = True,
+        model: str = "htdemucs"
+    ) -> bool:
+        """
+        Remove background music from a video's audio track
+        
+        Decodes the audio as raw PCM over a pipe instead of extracting
+        it to an intermediate WAV file.
+        """
+        if not self.demucs_available:
+            raise RuntimeError(
+                "Demucs not installed. Install with: pip install demucs"
+            )
+        
+        try:
+            import numpy as np
+            import torch
+            from demucs.audio import save_audio
             
-            sources = sources * ref.std() + ref.mean()
+            demucs_model, device = self._load_demucs_model(model)
+            channels = demucs_model.audio_channels
             
-            # Extract vocals or music
-            if keep_vocals:
-                output_audio = sources[3]  # vocals
-            else:
-                # Combine everything except vocals
-                output_audio = sources[0] + sources[1] + sources[2]
+            cmd = [
+                self.ffmpeg_path,
+                '-i', video_path,
+                '-vn',
+                '-f', 's16le',
+                '-acodec', 'pcm_s16le',
+                '-ac', str(channels),
+                '-ar', str(demucs_model.samplerate),
+                '-'
+            ]
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            pcm, _ = proc.communicate()
+            if proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd)
+            
+            samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, channels)
+            wav = np.ascontiguousarray(samples.T, dtype=np.float32)
+            wav /= 32768.0
+            wav = torch.from_numpy(wav)
+            
+            output_audio = self._separate(demucs_model, device, wav, keep_vocals)
             
-            # Save
             save_audio(
                 output_audio,
                 output_path,
@@ -113,21 +393,38 @@ class AudioProcessor:
             target_level: Target loudness in LUFS (-23 to -5)
         """
         try:
+            stats = self._measure_loudness(input_path, target_level)
+            input_i = float(stats['input_i'])
+            
+            # Already at target, or silent (measured as -inf) so there's
+            # nothing to scale: remux instead of re-encoding
+            if not math.isfinite(input_i) or abs(input_i - target_level) < 0.1:
+                cmd = [
+                    self.ffmpeg_path,
+                    '-i', input_path,
+                    '-c', 'copy',
+                    *self._thread_args,
+                    output_path,
+                    '-y'
+                ]
+                try:
+                    self._run_ffmpeg(cmd, explain_errors=False)
+                    return True
+                except subprocess.CalledProcessError:
+                    pass  # Container can't take a stream copy; re-encode
+            
+            # Pass 2: apply the measured values as a linear gain
             cmd = [
                 self.ffmpeg_path,
                 '-i', input_path,
-                '-af', f'loudnorm=I={target_level}:TP=-1.5:LRA=11',
+                *self._loudnorm_args(stats, target_level),
                 '-ar', '48000',
+                *self._thread_args,
                 output_path,
                 '-y'
             ]
             
-            subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                timeout=300
-            )
+            self._run_ffmpeg(cmd)
             
             return True
             
@@ -135,6 +432,38 @@ class AudioProcessor:
             print(f"Normalization error: {str(e)}")
             return False
     
+    def _measure_loudness(self, input_path: str, target_level: float) -> Dict[str, Any]:
+        """First loudnorm pass: the loudness stats of the first audio stream"""
+        measure = self._filter_for('normalize', target_level=target_level)
+        cmd = [
+            self.ffmpeg_path,
+            '-i', input_path,
+            '-map', '0:a:0',
+            '-af', measure + ':print_format=json',
+            '-f', 'null',
+            '-'
+        ]
+        
+        result = subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=Config.MAX_SUBPROCESS_TIMEOUT
+        )
+        
+        # loudnorm prints its measurements as the last JSON block, which
+        # is flat; other log lines may follow it
+        stderr = result.stderr.decode(errors='replace')
+        start = stderr.rindex('{')
+        return _json_loads(stderr[start:stderr.index('}', start) + 1])
+    
+    def _loudnorm_args(self, stats: Dict[str, Any], target_level: float) -> List[str]:
+        """Second loudnorm pass filter args; none for silent input (-inf)"""
+        if not math.isfinite(float(stats['input_i'])):
+            return []
+        return ['-af', _LOUDNORM_APPLY.format(target_level=target_level, **stats)]
+    
     def reduce_noise(
         self,
         input_path: str,
@@ -153,17 +482,13 @@ class AudioProcessor:
             cmd = [
                 self.ffmpeg_path,
                 '-i', input_path,
-                '-af', f'afftdn=nf={noise_reduction}',
+                '-af', self._filter_for('reduce_noise', noise_reduction=noise_reduction),
+                *self._thread_args,
                 output_path,
                 '-y'
             ]
             
-            subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                timeout=300
-            )
+            self._run_ffmpeg(cmd)
             
             return True
             
@@ -190,24 +515,18 @@ class AudioProcessor:
             treble: Treble adjustment (-20 to +20 dB)
         """
         try:
-            eq_filter = f'equalizer=f=100:t=h:w=200:g={bass},'
-            eq_filter += f'equalizer=f=1000:t=h:w=200:g={mid},'
-            eq_filter += f'equalizer=f=10000:t=h:w=200:g={treble}'
+            eq_filter = self._filter_for('eq', bass=bass, mid=mid, treble=treble)
             
             cmd = [
                 self.ffmpeg_path,
                 '-i', input_path,
                 '-af', eq_filter,
+                *self._thread_args,
                 output_path,
                 '-y'
             ]
             
-            subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                timeout=300
-            )
+            self._run_ffmpeg(cmd)
             
             return True
             
@@ -232,53 +551,63 @@ class AudioProcessor:
             **kwargs: Operation-specific parameters
         """
         try:
-            # Extract audio
-            temp_audio = tempfile.mktemp(suffix='.wav')
-            
-            cmd = [
-                self.ffmpeg_path,
-                '-i', video_path,
-                '-vn',
-                '-acodec', 'pcm_s16le',
-                temp_audio,
-                '-y'
-            ]
-            subprocess.run(cmd, check=True, capture_output=True)
-            
-            # Process audio
-            processed_audio = tempfile.mktemp(suffix='.wav')
-            
-            if operation == 'remove_music':
-                success = self.remove_music(temp_audio, processed_audio, **kwargs)
-            elif operation == 'normalize':
-                success = self.normalize_audio(temp_audio, processed_audio, **kwargs)
-            elif operation == 'reduce_noise':
-                success = self.reduce_noise(temp_audio, processed_audio, **kwargs)
-            elif operation == 'eq':
-                success = self.apply_eq(temp_audio, processed_audio, **kwargs)
-            else:
+            if operation in _FFMPEG_FILTER_OPS:
+                if operation == 'normalize':
+                    # Measured first, like normalize_audio, so both give
+                    # the same loudness for the same target
+                    target_level = kwargs.get(
+                        'target_level', _FFMPEG_FILTER_OPS['normalize'][1]['target_level']
+                    )
+                    stats = self._measure_loudness(video_path, target_level)
+                    audio_filter = self._loudnorm_args(stats, target_level)
+                else:
+                    audio_filter = ['-af', self._filter_for(operation, **kwargs)]
+                
+                # Filter, re-encode audio and copy video in one pass
+                cmd = [
+                    self.ffmpeg_path,
+                    '-i', video_path,
+                    '-map', '0:v:0',
+                    '-map', '0:a:0',
+                    '-c:v', 'copy',
+                    *audio_filter,
+                ]
+                if operation == 'normalize':
+                    cmd += ['-ar', '48000']
+                cmd += ['-c:a', 'aac', *self._thread_args, output_path, '-y']
+                self._run_ffmpeg(cmd)
+                return True
+            
+            if operation != 'remove_music':
                 raise ValueError(f"Unknown operation: {operation}")
             
-            if not success:
-                return False
-            
-            # Merge with video
-            cmd = [
-                self.ffmpeg_path,
-                '-i', video_path,
-                '-i', processed_audio,
-                '-c:v', 'copy',
-                '-c:a', 'aac',
-                '-map', '0:v:0',
-                '-map', '1:a:0',
-                output_path,
-                '-y'
-            ]
-            subprocess.run(cmd, check=True, capture_output=True)
-            
-            # Cleanup
-            os.remove(temp_audio)
-            os.remove(processed_audio)
+            # Demucs is not an FFmpeg filter: separate, then merge back.
+            # Intermediate files live in the configured temp dir and are
+            # removed with it, even on failure.
+            Config.ensure_directories()
+            with tempfile.TemporaryDirectory(dir=Config.TEMP_DIR) as temp_dir:
+                processed_audio = os.path.join(temp_dir, 'processed.wav')
+                
+                success = self._remove_music_from_video(
+                    video_path, processed_audio, **kwargs
+                )
+                if not success:
+                    return False
+                
+                # Merge with video
+                cmd = [
+                    self.ffmpeg_path,
+                    '-i', video_path,
+                    '-i', processed_audio,
+                    '-c:v', 'copy',
+                    '-c:a', 'aac',
+                    '-map', '0:v:0',
+                    '-map', '1:a:0',
+                    *self._thread_args,
+                    output_path,
+                    '-y'
+                ]
+                self._run_ffmpeg(cmd)
             
             return True
             
@@ -286,39 +615,41 @@ class AudioProcessor:
             print(f"Video audio processing error: {str(e)}")
             return False
     
+    def process_batch(
+        self,
+        jobs: List[Tuple[str, str, str, dict]]
+    ) -> List[bool]:
+        """
+        Process the audio of several videos in parallel
+        
+        Args:
+            jobs: (video_path, output_path, operation, kwargs) tuples,
+                as accepted by process_video_audio
+        
+        Returns:
+            Success flag for each job, in input order
+        """
+        if not jobs:
+            return []
+        
+        max_jobs = config.get("export", "max_concurrent_jobs") or 1
+        workers = max(1, min(len(jobs), max_jobs, Config.MAX_THREADS // 2))
+        
+        if workers == 1:
+            return [
+                self.process_video_audio(video, output, operation, **kwargs)
+                for video, output, operation, kwargs in jobs
+            ]
+        
+        # Processes rather than threads: spawning FFmpeg from many threads
+        # serializes on fork locks on some platforms
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_process_batch_job, jobs))
+    
     def get_audio_info(self, file_path: str) -> dict:
         """Get audio stream information"""
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_streams',
-                '-select_streams', 'a:0',
-                file_path
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            import json
-            data = json.loads(result.stdout)
-            
-            if data.get('streams'):
-                stream = data['streams'][0]
-                return {
-                    'codec': stream.get('codec_name'),
-                    'sample_rate': stream.get('sample_rate'),
-                    'channels': stream.get('channels'),
-                    'channel_layout': stream.get('channel_layout'),
-                    'bitrate': stream.get('bit_rate')
-                }
-            
-            return {}
-            
+            st = os.stat(file_path)
+            return dict(_probe_audio(file_path, st.st_mtime_ns, st.st_size))
         except Exception:
-            return {}
\ No newline at end of file
+            return {}
@@ -4,9 +4,10 @@ Auto-save and crash recovery system
 import json
 import os
 import shutil
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from PyQt5.QtCore import QTimer
 
 
@@ -23,6 +24,13 @@ class AutoSaveManager:
         self.backup_dir = Path.home() / '.video_editor' / 'autosave'
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
+        # Existing backups, oldest first; kept in sync as we save so
+        # cleanup doesn't need to rescan the directory every tick
+        self._backup_log = deque(
+            Path(entry.path)
+            for entry, _ in sorted(self._scan_backups(), key=lambda b: b[1].st_mtime)
+        )
+        
         self.current_project = None
         self.save_callback = None
     
@@ -63,6 +71,7 @@ class AutoSaveManager:
             
             # Call save callback
             self.save_callback(str(backup_path))
+            self._backup_log.append(backup_path)
             
             # Clean old backups (keep last 10)
             self._cleanup_old_backups()
@@ -72,49 +81,61 @@ class AutoSaveManager:
     
     def _cleanup_old_backups(self):
         """Remove old backup files"""
-        backups = sorted(
-            self.backup_dir.glob('autosave_*.vedproj'),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
-        
         # Keep only last 10
-        for backup in backups[10:]:
+        while len(self._backup_log) > 10:
             try:
-                backup.unlink()
-            except:
+                self._backup_log.popleft().unlink(missing_ok=True)
+            except OSError:
                 pass
     
-    def get_recovery_files(self) -> List[dict]:
-        """Get list of recoverable backup files"""
+    def _scan_backups(self) -> List[Tuple[os.DirEntry, os.stat_result]]:
+        """List backup files with their stat info in one directory pass"""
         backups = []
         
-        for backup_path in self.backup_dir.glob('autosave_*.vedproj'):
-            try:
-                stat = backup_path.stat()
-                backups.append({
-                    'path': str(backup_path),
-                    'name': backup_path.stem,
-                    'modified': datetime.fromtimestamp(stat.st_mtime),
-                    'size': stat.st_size
-                })
-            except:
-                continue
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith('autosave_') and name.endswith('.vedproj')):
+                    continue
+                try:
+                    backups.append((entry, entry.stat()))
+                except OSError:
+                    continue
+        
+        return backups
+    
+    def get_recovery_files(self) -> List[dict]:
+        """Get list of recoverable backup files"""
+        backups = [
+            {
+                'path': entry.path,
+                'name': os.path.splitext(entry.name)[0],
+                'modified': datetime.fromtimestamp(stat.st_mtime),
+                'size': stat.st_size
+            }
+            for entry, stat in self._scan_backups()
+        ]
         
         return sorted(backups, key=lambda b: b['modified'], reverse=True)
     
     def has_recovery_files(self) -> bool:
         """Check if recovery files exist"""
-        return len(list(self.backup_dir.glob('autosave_*.vedproj'))) > 0
+        return bool(self._backup_log)
     
     def clear_recovery_files(self):
         """Clear all recovery files"""
-        for backup in self.backup_dir.glob('autosave_*.vedproj'):
-            try:
-                backup.unlink()
-            except:
-                pass
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith('autosave_') and name.endswith('.vedproj')):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+        self._backup_log.clear()
     
     def recover_from_backup(self, backup_path: str, target_path: str):
         """Recover project from backup"""
-        shutil.copy2(backup_path, target_path)
\ No newline at end of file
+        # Content only; the backup's timestamps mean nothing for the new project
+        shutil.copyfile(backup_path, target_path)
\ No newline at end of file
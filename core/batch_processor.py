@@ -1,28 +1,136 @@
 """
 Batch processing for multiple videos
 """
+import multiprocessing
 import os
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Callable, Optional
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, List, Dict, Callable, Iterator, Optional, Sequence, Tuple
+from dataclasses import dataclass, replace
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
 
 from core.segment import Segment
+from utils.compat import DATACLASS_SLOTS
 from core.video_engine import VideoEngine, ProcessingOptions, ProcessingResult
 from models.export_profile import ExportProfile
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchJob:
     """Represents a batch processing job"""
     video_path: str
-    segments: List[Segment]
+    segments: Tuple[Segment, ...]
     output_dir: str
-    status: str = "pending"  # pending, processing, complete, failed
+    status: str = "pending"  # pending, processing, complete, failed, cancelled
     error: Optional[str] = None
     results: List[ProcessingResult] = None
 
 
+def _options_for_profile(export_profile: ExportProfile) -> ProcessingOptions:
+    """Build processing options from an export profile"""
+    job_options = ProcessingOptions(
+        output_format=export_profile.container,
+        video_codec=export_profile.video_codec.codec,
+        video_bitrate=export_profile.video_codec.bitrate,
+        video_preset=export_profile.video_codec.preset,
+        video_crf=export_profile.video_codec.crf,
+        video_pixel_format=export_profile.video_codec.pixel_format,
+        width=export_profile.width,
+        height=export_profile.height,
+        fps=export_profile.fps,
+        maintain_aspect_ratio=export_profile.maintain_aspect_ratio,
+        audio_codec=export_profile.audio_codec.codec,
+        audio_bitrate=export_profile.audio_codec.bitrate,
+        audio_sample_rate=export_profile.audio_codec.sample_rate,
+        audio_channels=export_profile.audio_codec.channels,
+        normalize_audio=export_profile.normalize_audio,
+        metadata=export_profile.metadata.copy(),
+        extra_args=export_profile.extra_ffmpeg_args.split() if export_profile.extra_ffmpeg_args else []
+    )
+    
+    # If max_rate and buf_size are set, add them to extra_args
+    if export_profile.video_codec.max_rate:
+        job_options.extra_args.extend(["-maxrate", export_profile.video_codec.max_rate])
+    if export_profile.video_codec.buf_size:
+        job_options.extra_args.extend(["-bufsize", export_profile.video_codec.buf_size])
+    
+    return job_options
+
+
+def _run_job(
+    job: BatchJob,
+    options: ProcessingOptions,
+    export_profile: Optional[ExportProfile],
+    segment_workers: int,
+    cancel_event: Any
+) -> Tuple[str, Optional[str], Optional[List[ProcessingResult]]]:
+    """
+    Process one batch job in a worker process
+    
+    Uses its own VideoEngine since engines carry per-run state.
+    
+    Args:
+        job: Job to process
+        options: Processing options, unless export_profile is given
+        export_profile: Optional export profile to apply
+        segment_workers: FFmpeg processes this job may run at once
+        cancel_event: Shared event; once set, stop after the current segment
+    
+    Returns:
+        (status, error, results)
+    """
+    # Cancelled before this job started; it can run again later
+    if cancel_event.is_set():
+        return "pending", None, None
+    
+    try:
+        engine = VideoEngine()
+        
+        # Load video
+        engine.load_video(job.video_path)
+        
+        # Adjust segments to video duration
+        adjusted_segments = BatchProcessor._adjust_segments_to_video(
+            job.segments,
+            engine.video_info['duration']
+        )
+        
+        # Apply export profile to options if provided
+        if export_profile:
+            job_options = _options_for_profile(export_profile)
+        else:
+            job_options = options
+        job_options = replace(job_options, max_workers=segment_workers)
+        
+        def check_cancel(current: int, total: int, message: str):
+            # Called between segments; the engine stops at its next check
+            if cancel_event.is_set():
+                engine.cancel_processing()
+        
+        # Stream-copy jobs split in a single ffmpeg pass
+        if job_options.codec_copy:
+            process = engine.process_segments_copy_fast
+        else:
+            process = engine.process_segments
+        
+        # Process
+        results = process(
+            adjusted_segments,
+            job.output_dir,
+            job_options,
+            check_cancel
+        )
+        
+        if cancel_event.is_set():
+            return "cancelled", None, results
+        return "complete", None, results
+        
+    except Exception as e:
+        return "failed", str(e), None
+
+
 class BatchProcessor:
     """Process multiple videos with same segment configuration"""
     
@@ -30,12 +138,14 @@ class BatchProcessor:
         self.engine = VideoEngine()
         self.jobs: List[BatchJob] = []
         self._cancel_requested = False
+        # Shared with the worker processes while a batch runs
+        self._cancel_event = None
     
     def add_job(self, video_path: str, segments: List[Segment], output_dir: str):
         """Add a job to the batch"""
         job = BatchJob(
             video_path=video_path,
-            segments=segments.copy(),
+            segments=tuple(segments),
             output_dir=output_dir
         )
         self.jobs.append(job)
@@ -59,81 +169,102 @@ class BatchProcessor:
             progress_callback: Callback(current_job, total_jobs, message)
         
         Returns:
-            List of completed jobs
+            List of all jobs
+        """
+        for _ in self.iter_process_all(options, export_profile, progress_callback):
+            pass
+        
+        return self.jobs
+    
+    def iter_process_all(
+        self,
+        options: ProcessingOptions,
+        export_profile: Optional[ExportProfile] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Iterator[BatchJob]:
+        """
+        Process all jobs, yielding each one as it finishes
+        
+        Jobs run in parallel worker processes, each with its own
+        VideoEngine, and are yielded first-finished-first whether they
+        completed, failed or were cancelled. After cancel(), jobs not yet
+        started go back to pending and running ones stop between segments.
+        
+        Args:
+            options: Processing options to use for all jobs
+            export_profile: Optional export profile to apply
+            progress_callback: Callback(current_job, total_jobs, message)
+        
+        Yields:
+            Each finished job
         """
         total = len(self.jobs)
+        if not total or self._cancel_requested:
+            return
+        
+        # NVENC and friends only allow a few concurrent sessions
+        max_workers = max(1, options.max_workers)
+        if options.use_gpu:
+            max_workers = min(max_workers, 2)
+        job_workers = min(max_workers, total)
+        # Split the FFmpeg budget between jobs instead of giving each all of it
+        segment_workers = max(1, max_workers // job_workers)
+        
+        completed = 0
         
-        for i, job in enumerate(self.jobs, 1):
+        with multiprocessing.Manager() as manager, \
+                ProcessPoolExecutor(max_workers=job_workers) as executor:
+            self._cancel_event = manager.Event()
             if self._cancel_requested:
-                break
-            
-            if progress_callback:
-                progress_callback(i, total, f"Processing: {Path(job.video_path).name}")
+                self._cancel_event.set()
             
             try:
-                job.status = "processing"
-                
-                # Load video
-                self.engine.load_video(job.video_path)
-                
-                # Adjust segments to video duration
-                adjusted_segments = self._adjust_segments_to_video(
-                    job.segments,
-                    self.engine.video_info['duration']
-                )
-                
-                # Apply export profile to options if provided
-                if export_profile:
-                    # Create a copy of options to not modify the original
-                    job_options = ProcessingOptions(
-                        output_format=export_profile.container,
-                        video_codec=export_profile.video_codec.codec,
-                        video_bitrate=export_profile.video_codec.bitrate,
-                        video_preset=export_profile.video_codec.preset,
-                        video_crf=export_profile.video_codec.crf,
-                        video_pixel_format=export_profile.video_codec.pixel_format,
-                        width=export_profile.width,
-                        height=export_profile.height,
-                        fps=export_profile.fps,
-                        maintain_aspect_ratio=export_profile.maintain_aspect_ratio,
-                        audio_codec=export_profile.audio_codec.codec,
-                        audio_bitrate=export_profile.audio_codec.bitrate,
-                        audio_sample_rate=export_profile.audio_codec.sample_rate,
-                        audio_channels=export_profile.audio_codec.channels,
-                        normalize_audio=export_profile.normalize_audio,
-                        metadata=export_profile.metadata.copy(),
-                        extra_args=export_profile.extra_ffmpeg_args.split() if export_profile.extra_ffmpeg_args else []
+                future_to_job = {}
+                for job in self.jobs:
+                    job.status = "processing"
+                    future = executor.submit(
+                        _run_job, job, options, export_profile,
+                        segment_workers, self._cancel_event
                     )
-                    
-                    # If max_rate and buf_size are set, add them to extra_args
-                    if export_profile.video_codec.max_rate:
-                        job_options.extra_args.extend(["-maxrate", export_profile.video_codec.max_rate])
-                    if export_profile.video_codec.buf_size:
-                        job_options.extra_args.extend(["-bufsize", export_profile.video_codec.buf_size])
-                else:
-                    job_options = options
+                    future_to_job[future] = job
                 
-                # Process
-                results = self.engine.process_segments(
-                    adjusted_segments,
-                    job.output_dir,
-                    job_options
-                )
-                
-                job.results = results
-                job.status = "complete"
+                cancelling = False
+                for future in as_completed(future_to_job):
+                    if future.cancelled():
+                        continue
+                    job = future_to_job[future]
+                    
+                    try:
+                        job.status, job.error, job.results = future.result()
+                    except Exception as e:
+                        job.status = "failed"
+                        job.error = str(e)
+                    
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(
+                            completed,
+                            total,
+                            f"Completed: {Path(job.video_path).name}"
+                        )
+                    
+                    yield job
+                    
+                    # Keep collecting running jobs so each gets a final status
+                    if self._cancel_requested and not cancelling:
+                        cancelling = True
+                        for pending, pending_job in future_to_job.items():
+                            if pending.cancel():
+                                pending_job.status = "pending"
                 
-            except Exception as e:
-                job.status = "failed"
-                job.error = str(e)
-        
-        return self.jobs
+            finally:
+                self._cancel_event = None
     
+    @staticmethod
     def _adjust_segments_to_video(
-        self,
-        segments: List[Segment],
+        segments: Sequence[Segment],
         video_duration: float
-    ) -> List[Segment]:
+    ) -> Sequence[Segment]:
         """
         Adjust segments to fit within video duration
         
@@ -142,42 +273,49 @@ class BatchProcessor:
         if not segments:
             return []
         
-        max_end = max(s.end for s in segments)
+        count = len(segments)
+        starts = np.fromiter((s.start for s in segments), dtype=np.float64, count=count)
+        ends = np.fromiter((s.end for s in segments), dtype=np.float64, count=count)
+        
+        max_end = ends.max()
         
         if max_end <= video_duration:
             return segments
         
         # Scale segments to fit
         scale = video_duration / max_end
-        adjusted = []
+        starts *= scale
+        ends *= scale
         
-        for seg in segments:
-            adjusted.append(Segment(
-                start=seg.start * scale,
-                end=seg.end * scale,
+        return [
+            Segment(
+                start=start,
+                end=end,
                 label=seg.label,
                 color=seg.color,
                 export_video=seg.export_video,
                 export_audio=seg.export_audio
-            ))
-        
-        return adjusted
+            )
+            for seg, start, end in zip(segments, starts.tolist(), ends.tolist())
+        ]
     
     def cancel(self):
         """Cancel batch processing"""
         self._cancel_requested = True
         self.engine.cancel_processing()
+        
+        cancel_event = self._cancel_event
+        if cancel_event is not None:
+            cancel_event.set()
     
     def get_summary(self) -> Dict:
         """Get batch processing summary"""
-        total = len(self.jobs)
-        complete = sum(1 for j in self.jobs if j.status == "complete")
-        failed = sum(1 for j in self.jobs if j.status == "failed")
-        pending = sum(1 for j in self.jobs if j.status == "pending")
+        counts = Counter(j.status for j in self.jobs)
         
         return {
-            'total': total,
-            'complete': complete,
-            'failed': failed,
-            'pending': pending
-        }
\ No newline at end of file
+            'total': len(self.jobs),
+            'complete': counts['complete'],
+            'failed': counts['failed'],
+            'cancelled': counts['cancelled'],
+            'pending': counts['pending']
+        }
@@ -2,11 +2,26 @@
 Filename template system for export customization
 """
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 import re
 
 
+# Characters not allowed in filenames
+_SANITIZE_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Template variables, e.g. {label}; _TOKEN_RE keeps them when splitting
+_VAR_RE = re.compile(r'\{([^}]+)\}')
+_TOKEN_RE = re.compile(r'(\{[^}]+\})')
+
+
+@lru_cache(maxsize=4096)
+def _int_str(value: int) -> str:
+    """Whole seconds as text; segment times repeat a lot across exports"""
+    return str(value)
+
+
 class FilenameTemplate:
     """Handle filename templates with variables"""
     
@@ -24,10 +39,31 @@ class FilenameTemplate:
         '{project}': 'Project name'
     }
     
+    # Bare variable names, for validation
+    _KNOWN_VARS = frozenset(var.strip('{}') for var in VARIABLES)
+    
     DEFAULT_TEMPLATE = "{label}_{start}_{end}"
     
     def __init__(self, template: str = None):
         self.template = template or self.DEFAULT_TEMPLATE
+        
+        # Parse once into (is_variable, name_or_literal) tokens so format()
+        # is a single pass instead of one replace() per variable
+        self._tokens = []
+        for part in _TOKEN_RE.split(self.template):
+            if not part:
+                continue
+            name = part[1:-1]
+            if part[0] == '{' and name in self._RESOLVERS:
+                self._tokens.append((True, name))
+            else:
+                self._tokens.append((False, part))
+        
+        # Only read the clock when the template shows it
+        self._needs_now = any(
+            is_var and value in ('date', 'time')
+            for is_var, value in self._tokens
+        )
     
     def format(self, **kwargs) -> str:
         """
@@ -45,40 +81,19 @@ class FilenameTemplate:
         Returns:
             Formatted filename
         """
-        result = self.template
-        
-        # Simple replacements
-        replacements = {
-            '{label}': kwargs.get('label', 'Untitled'),
-            '{start}': str(int(kwargs.get('start', 0))),
-            '{end}': str(int(kwargs.get('end', 0))),
-            '{duration}': str(int(kwargs.get('duration', 0))),
-            '{index}': str(kwargs.get('index', 1)),
-            '{date}': datetime.now().strftime('%Y-%m-%d'),
-            '{time}': datetime.now().strftime('%H-%M-%S'),
-            '{project}': kwargs.get('project_name', 'project')
-        }
-        
-        # Time formatting
-        if '{start_time}' in result:
-            replacements['{start_time}'] = self._format_time(kwargs.get('start', 0))
-        
-        if '{end_time}' in result:
-            replacements['{end_time}'] = self._format_time(kwargs.get('end', 0))
-        
-        # Video filename
-        if '{video}' in result:
-            video_path = kwargs.get('video_path', '')
-            if video_path:
-                replacements['{video}'] = Path(video_path).stem
-            else:
-                replacements['{video}'] = 'video'
-        
-        # Apply replacements
-        for var, value in replacements.items():
-            result = result.replace(var, self._sanitize(value))
-        
-        return result
+        resolvers = self._RESOLVERS
+        now = datetime.now() if self._needs_now else None
+        return ''.join(
+            self._sanitize(resolvers[value](self, kwargs, now)) if is_var else value
+            for is_var, value in self._tokens
+        )
+    
+    def _video_name(self, kwargs: Dict[str, Any]) -> str:
+        """Source video filename without extension"""
+        video_path = kwargs.get('video_path', '')
+        if video_path:
+            return Path(video_path).stem
+        return 'video'
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds as HH-MM-SS"""
@@ -90,7 +105,7 @@ class FilenameTemplate:
     def _sanitize(self, text: str) -> str:
         """Remove invalid filename characters"""
         # Remove invalid characters
-        text = re.sub(r'[<>:"/\\|?*]', '_', text)
+        text = _SANITIZE_RE.sub('_', text)
         # Remove leading/trailing spaces and dots
         text = text.strip('. ')
         return text
@@ -103,10 +118,9 @@ class FilenameTemplate:
             (is_valid, error_message)
         """
         # Check for unknown variables
-        pattern = r'\{([^}]+)\}'
-        variables = re.findall(pattern, self.template)
+        variables = _VAR_RE.findall(self.template)
         
-        unknown = [v for v in variables if f'{{{v}}}' not in self.VARIABLES]
+        unknown = [v for v in variables if v not in self._KNOWN_VARS]
         if unknown:
             return False, f"Unknown variables: {', '.join(unknown)}"
         
@@ -128,6 +142,21 @@ class FilenameTemplate:
         """Generate preview of formatted filename"""
         return self.format(**kwargs)
     
+    # Variable name -> resolver(template, kwargs, now)
+    _RESOLVERS = {
+        'label': lambda self, kw, now: kw.get('label', 'Untitled'),
+        'start': lambda self, kw, now: _int_str(int(kw.get('start', 0))),
+        'end': lambda self, kw, now: _int_str(int(kw.get('end', 0))),
+        'duration': lambda self, kw, now: _int_str(int(kw.get('duration', 0))),
+        'index': lambda self, kw, now: str(kw.get('index', 1)),
+        'date': lambda self, kw, now: now.strftime('%Y-%m-%d'),
+        'time': lambda self, kw, now: now.strftime('%H-%M-%S'),
+        'project': lambda self, kw, now: kw.get('project_name', 'project'),
+        'start_time': lambda self, kw, now: self._format_time(kw.get('start', 0)),
+        'end_time': lambda self, kw, now: self._format_time(kw.get('end', 0)),
+        'video': lambda self, kw, now: self._video_name(kw),
+    }
+    
     @classmethod
     def get_presets(cls) -> Dict[str, str]:
         """Get predefined templates"""
@@ -1,13 +1,67 @@
 """
 Export preset management for saving/loading common configurations
 """
+import copy
+import functools
 import json
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from core.video_engine import ProcessingOptions
 
 
+@functools.lru_cache(maxsize=1)
+def _builtin_presets() -> Dict[str, ProcessingOptions]:
+    """Built-in presets, constructed on first use"""
+    return {
+        'Fast & Small (Mono)': ProcessingOptions(
+            audio_channels='mono',
+            use_gpu=True,
+            codec_copy=True,
+            mp3_quality=5,
+            output_format='mp4',
+            parallel_processing=True,
+            max_workers=4
+        ),
+        'Best Quality (Stereo)': ProcessingOptions(
+            audio_channels='stereo',
+            use_gpu=True,
+            codec_copy=False,
+            mp3_quality=0,
+            output_format='mp4',
+            parallel_processing=True,
+            max_workers=4
+        ),
+        'Conference Recording': ProcessingOptions(
+            audio_channels='mono',
+            use_gpu=True,
+            codec_copy=True,
+            mp3_quality=2,
+            output_format='mp4',
+            parallel_processing=True,
+            max_workers=6
+        ),
+        'Music Video': ProcessingOptions(
+            audio_channels='stereo',
+            use_gpu=True,
+            codec_copy=False,
+            mp3_quality=0,
+            output_format='mp4',
+            parallel_processing=True,
+            max_workers=2
+        ),
+        'Archive (MKV)': ProcessingOptions(
+            audio_channels=None,
+            use_gpu=False,
+            codec_copy=True,
+            mp3_quality=2,
+            output_format='mkv',
+            parallel_processing=True,
+            max_workers=8
+        )
+    }
+
+
 class PresetManager:
     """Manage export presets"""
     
@@ -20,54 +74,13 @@ class PresetManager:
         
         self.presets_dir.mkdir(parents=True, exist_ok=True)
         
-        # Built-in presets
-        self.builtin_presets = {
-            'Fast & Small (Mono)': ProcessingOptions(
-                audio_channels='mono',
-                use_gpu=True,
-                codec_copy=True,
-                mp3_quality=5,
-                output_format='mp4',
-                parallel_processing=True,
-                max_workers=4
-            ),
-            'Best Quality (Stereo)': ProcessingOptions(
-                audio_channels='stereo',
-                use_gpu=True,
-                codec_copy=False,
-                mp3_quality=0,
-                output_format='mp4',
-                parallel_processing=True,
-                max_workers=4
-            ),
-            'Conference Recording': ProcessingOptions(
-                audio_channels='mono',
-                use_gpu=True,
-                codec_copy=True,
-                mp3_quality=2,
-                output_format='mp4',
-                parallel_processing=True,
-                max_workers=6
-            ),
-            'Music Video': ProcessingOptions(
-                audio_channels='stereo',
-                use_gpu=True,
-                codec_copy=False,
-                mp3_quality=0,
-                output_format='mp4',
-                parallel_processing=True,
-                max_workers=2
-            ),
-            'Archive (MKV)': ProcessingOptions(
-                audio_channels=None,
-                use_gpu=False,
-                codec_copy=True,
-                mp3_quality=2,
-                output_format='mkv',
-                parallel_processing=True,
-                max_workers=8
-            )
-        }
+        # (presets dir mtime, sorted preset names) from the last listing
+        self._list_cache: Optional[Tuple[int, List[str]]] = None
+    
+    @property
+    def builtin_presets(self) -> Dict[str, ProcessingOptions]:
+        """Built-in presets, shared by all instances"""
+        return _builtin_presets()
     
     def save_preset(self, name: str, options: ProcessingOptions) -> bool:
         """Save an export preset"""
@@ -85,17 +98,19 @@ class PresetManager:
             }
             
             with open(preset_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                json.dump(data, f, separators=(',', ':'))
             
+            self._list_cache = None
             return True
-        except:
+        except (OSError, TypeError, ValueError):
             return False
     
     def load_preset(self, name: str) -> Optional[ProcessingOptions]:
         """Load an export preset"""
         # Check built-in presets first
         if name in self.builtin_presets:
-            return self.builtin_presets[name]
+            # Copy so callers can't alter the shared defaults
+            return copy.deepcopy(self.builtin_presets[name])
         
         # Check user presets
         try:
@@ -116,7 +131,7 @@ class PresetManager:
                 parallel_processing=data.get('parallel_processing', True),
                 max_workers=data.get('max_workers', 4)
             )
-        except:
+        except (OSError, ValueError, AttributeError):
             return None
     
     def delete_preset(self, name: str) -> bool:
@@ -129,25 +144,37 @@ class PresetManager:
             preset_path = self.presets_dir / f"{name}.json"
             if preset_path.exists():
                 preset_path.unlink()
+                self._list_cache = None
                 return True
-        except:
+        except OSError:
             pass
         
         return False
     
     def list_presets(self) -> List[str]:
         """List all available presets"""
+        try:
+            mtime = self.presets_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        if self._list_cache and mtime is not None and self._list_cache[0] == mtime:
+            return list(self._list_cache[1])
+        
         # Built-in presets
-        presets = list(self.builtin_presets.keys())
+        presets = set(self.builtin_presets.keys())
         
         # User presets
-        if self.presets_dir.exists():
-            for path in self.presets_dir.glob('*.json'):
-                preset_name = path.stem
-                if preset_name not in presets:
-                    presets.append(preset_name)
+        if mtime is not None:
+            with os.scandir(self.presets_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json'):
+                        presets.add(entry.name[:-len('.json')])
         
-        return sorted(presets)
+        presets = sorted(presets)
+        if mtime is not None:
+            self._list_cache = (mtime, presets)
+        return list(presets)
     
     def is_builtin(self, name: str) -> bool:
         """Check if preset is built-in"""
@@ -176,7 +203,7 @@ class PresetManager:
                 json.dump(user_presets, f, indent=2)
             
             return True
-        except:
+        except (OSError, TypeError, ValueError):
             return False
     
     def import_presets(self, import_path: str) -> int:
@@ -200,6 +227,7 @@ class PresetManager:
                 if self.save_preset(name, options):
                     count += 1
             
+            self._list_cache = None
             return count
-        except:
+        except (OSError, ValueError, AttributeError):
             return 0
\ No newline at end of file
@@ -1,22 +1,46 @@
 """
 Recent projects management
 """
+import atexit
 import json
 import os
+import time
+import weakref
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime
 
 
+# Live managers, flushed by one exit hook instead of one per instance
+_managers: 'weakref.WeakSet[RecentProjectsManager]' = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    """Write out changes any manager is still holding back"""
+    for manager in list(_managers):
+        manager._flush()
+
+
 class RecentProjectsManager:
     """Manage recently opened projects"""
     
+    # Seconds a file existence check is trusted before re-checking
+    EXISTENCE_TTL = 5.0
+    
+    # Minimum seconds between writes; anything newer is flushed at exit
+    SAVE_DEBOUNCE = 1.0
+    
     def __init__(self, max_recent: int = 10):
         self.max_recent = max_recent
         self.config_dir = Path.home() / '.video_editor'
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.config_file = self.config_dir / 'recent_projects.json'
         self.projects = self._load()
+        self._existence_cache: Dict[str, Tuple[float, bool]] = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        _managers.add(self)
     
     def _load(self) -> List[Dict]:
         """Load recent projects from config"""
@@ -27,20 +51,36 @@ class RecentProjectsManager:
             with open(self.config_file, 'r') as f:
                 data = json.load(f)
             return data.get('projects', [])
-        except:
+        except (OSError, ValueError, AttributeError):
             return []
     
     def _save(self):
-        """Save recent projects to config"""
+        """Mark projects changed and write them unless a write just happened"""
+        self._dirty = True
+        now = time.monotonic()
+        if now - self._last_flush > self.SAVE_DEBOUNCE:
+            self._flush()
+            self._last_flush = now
+    
+    def _flush(self):
+        """Write recent projects to config if they changed"""
+        if not self._dirty:
+            return
+        
+        self._dirty = False
         try:
             with open(self.config_file, 'w') as f:
-                json.dump({'projects': self.projects}, f, indent=2)
-        except:
+                json.dump({'projects': self.projects}, f, separators=(',', ':'))
+        except (OSError, TypeError, ValueError):
             pass
     
     def add_project(self, project_path: str, video_path: str = None):
         """Add project to recent list"""
-        if not os.path.exists(project_path):
+        # Usually just saved, so check afresh; this also replaces a cached
+        # "missing" that would make the listing drop it
+        exists = os.path.exists(project_path)
+        self._existence_cache[project_path] = (time.monotonic(), exists)
+        if not exists:
             return
         
         # Remove if already exists
@@ -57,9 +97,7 @@ class RecentProjectsManager:
         # Limit size
         self.projects = self.projects[:self.max_recent]
         
-        # Clean up missing files
-        self._cleanup()
-        
+        # Missing files are pruned lazily in get_recent()
         self._save()
     
     def get_recent(self) -> List[Dict]:
@@ -72,10 +110,23 @@ class RecentProjectsManager:
         self.projects = []
         self._save()
     
+    def _exists(self, path: str) -> bool:
+        """Check a project file exists, reusing recent results"""
+        now = time.monotonic()
+        cached = self._existence_cache.get(path)
+        if cached and now - cached[0] < self.EXISTENCE_TTL:
+            return cached[1]
+        
+        exists = os.path.exists(path)
+        self._existence_cache[path] = (now, exists)
+        return exists
+    
     def _cleanup(self):
         """Remove projects with missing files"""
+        before = len(self.projects)
         self.projects = [
             p for p in self.projects 
-            if os.path.exists(p['path'])
+            if self._exists(p['path'])
         ]
-        self._save()
\ No newline at end of file
+        if len(self.projects) != before:
+            self._save()
\ No newline at end of file
@@ -1,44 +1,200 @@
 """
 Scene detection with ML-based classification
+
+OpenCV, NumPy, torch and the ML service are imported on first use so
+plain FFmpeg scene/silence detection doesn't pay for them.
 """
+from __future__ import annotations
+
 import subprocess
 import json
 import os
-from typing import List, Tuple, Optional, Dict, Any
-import cv2
-import numpy as np
-import torch
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import bisect
+import contextlib
+import tempfile
+from typing import List, Tuple, Optional, Dict, Any, Iterable, Iterator, Union, TYPE_CHECKING
 from pathlib import Path
+from functools import lru_cache
 import logging
 
 from core.segment import Segment
 from models.scene_models import SceneMetadata
-from services.service_registry import ServiceRegistry
-from services.ml_service import MLService
+
+if TYPE_CHECKING:
+    import cv2
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Scene classifier input size (square RGB frames)
+FRAME_SIZE = 224
+
+# Frames per classifier forward pass; all scenes share these batches
+CLASSIFY_BATCH_SIZE = 256
+
+# Threads scoring faces/motion alongside the classifier
+SCORING_WORKERS = 4
+
+# FFmpeg prints times with %g, so allow a sign and an exponent. The
+# patterns are bytes: stderr is matched raw instead of decoded first
+_TIME = rb'(-?\d+(?:\.\d+)?(?:e[-+]?\d+)?)'
+_PTS_RE = re.compile(rb'pts_time:' + _TIME)
+_SILENCE_RE = re.compile(rb'silence_(start|end):\s*' + _TIME)
+_DURATION_RE = re.compile(rb'Duration: (\d+):(\d+):(\d+(?:\.\d+)?)')
+
+# Fixed parts of the ffprobe commands; only the input path varies
+_PROBE_DURATION_ARGS = (
+    'ffprobe',
+    '-v', 'error',
+    '-show_entries', 'format=duration',
+    '-of', 'default=noprint_wrappers=1:nokey=1'
+)
+_PROBE_KEYFRAMES_ARGS = (
+    'ffprobe',
+    '-v', 'error',
+    '-select_streams', 'v:0',
+    '-show_entries', 'packet=pts_time,flags:format=start_time',
+    '-of', 'csv'
+)
+
+
+
+def _output_lines(ffmpeg_output: Union[str, bytes, Iterable[bytes]]) -> Iterable[bytes]:
+    """FFmpeg output as byte lines, whether given whole or line by line"""
+    if isinstance(ffmpeg_output, str):
+        ffmpeg_output = ffmpeg_output.encode()
+    if isinstance(ffmpeg_output, bytes):
+        return (ffmpeg_output,)
+    return ffmpeg_output
+
+
+def _append_pts(timestamps: List[float], line: bytes) -> None:
+    """Add a line's pts_time values to a sorted, duplicate-free list"""
+    for m in _PTS_RE.finditer(line):
+        t = float(m.group(1))
+        # showinfo reports frames in PTS order, so this is the usual case
+        if not timestamps or t > timestamps[-1]:
+            timestamps.append(t)
+            continue
+        i = bisect.bisect_left(timestamps, t)
+        if timestamps[i] != t:
+            timestamps.insert(i, t)
+
+
+def _parse_duration(line: bytes) -> Optional[float]:
+    """Seconds from FFmpeg's 'Duration: HH:MM:SS.xx' input banner line"""
+    m = _DURATION_RE.search(line)
+    if not m:
+        return None
+    h, mins, secs = m.groups()
+    return int(h) * 3600 + int(mins) * 60 + float(secs)
+
+
+@lru_cache(maxsize=256)
+def _probe_duration(video_path: str, mtime_ns: int, size: int) -> float:
+    """ffprobe a video's duration; the stat values only key the cache"""
+    result = subprocess.run(
+        [*_PROBE_DURATION_ARGS, video_path],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=10
+    )
+    
+    return float(result.stdout.strip())
+
+
+def _motion_score_cv(frames: np.ndarray) -> float:
+    """Mean absolute difference between consecutive uint8 frames, in 0-1"""
+    import cv2
+    import numpy as np
+    
+    diffs = [cv2.absdiff(frames[i + 1], frames[i]).mean() for i in range(len(frames) - 1)]
+    return float(np.mean(diffs)) / 255.0
+
+
+@lru_cache(maxsize=None)
+def _motion_kernel():
+    """Numba-compiled motion score, or the OpenCV version without numba"""
+    try:
+        from numba import njit
+    except ImportError:  # Optional; motion scoring falls back to OpenCV
+        return _motion_score_cv
+    
+    @njit(cache=True, fastmath=True, nogil=True)
+    def motion_score(frames):
+        """Mean absolute difference between consecutive uint8 frames, in 0-1"""
+        n, h, w, c = frames.shape
+        total = 0.0
+        for i in range(n - 1):
+            for y in range(h):
+                for x in range(w):
+                    for k in range(c):
+                        total += abs(int(frames[i + 1, y, x, k]) - int(frames[i, y, x, k]))
+        return total / ((n - 1) * h * w * c * 255.0)
+    
+    return motion_score
+
+
+def _frame_batches(scene_frames: List[np.ndarray], size: int) -> Iterator[np.ndarray]:
+    """Every scene's frames in order, joined into arrays of up to size"""
+    import numpy as np
+    
+    pending = []
+    pending_count = 0
+    for frames in scene_frames:
+        start = 0
+        while start < len(frames):
+            take = min(size - pending_count, len(frames) - start)
+            pending.append(frames[start:start + take])
+            pending_count += take
+            start += take
+            if pending_count == size:
+                yield np.concatenate(pending)
+                pending = []
+                pending_count = 0
+    if pending:
+        yield np.concatenate(pending)
+
 
 class SceneDetector:
     """Detect scene changes in video"""
     
     SHOT_TYPES = ['extreme-wide', 'wide', 'medium', 'close-up', 'extreme-close-up']
     
+    # Analysis passes decode everything and discard the output
+    _NULL_OUTPUT = ('-f', 'null', '-')
+    
     def __init__(self):
         self.ffmpeg_path = 'ffmpeg'
         self.threshold = 0.3  # Scene change threshold (0.0-1.0)
         
-        # Initialize ML service
-        self.ml_service = ServiceRegistry().get_service(MLService)
+        # ML service is looked up on first use (see ml_service)
+        self._ml_service = None
         self.scene_model = None
         self.device = None
+        # Cascades aren't safe to share between the scoring threads
+        self._face_cascades = threading.local()
+    
+    @property
+    def ml_service(self):
+        """ML service, imported and looked up on first access"""
+        if self._ml_service is None:
+            from services.service_registry import ServiceRegistry
+            from services.ml_service import MLService
+            self._ml_service = ServiceRegistry().get_service(MLService)
+        return self._ml_service
     
     def detect_scenes(
         self,
         video_path: str,
         threshold: float = 0.3,
         min_scene_length: float = 2.0,
-        analyze_content: bool = True
+        analyze_content: bool = True,
+        min_analysis_length: float = 5.0
     ) -> List[SceneMetadata]:
         """
         Detect scene changes using FFmpeg
@@ -47,35 +203,26 @@ class SceneDetector:
             video_path: Path to video file
             threshold: Scene change sensitivity (0.0-1.0, lower = more sensitive)
             min_scene_length: Minimum scene length in seconds
+            min_analysis_length: Scenes shorter than this are analyzed from
+                a single frame, without a motion score
         
         Returns:
             List of (start, end) tuples for each scene
         """
         try:
             # Use FFmpeg scene detection filter
-            cmd = [
-                self.ffmpeg_path,
-                '-i', video_path,
-                '-filter:v', f'select=gt(scene\\,{threshold}),showinfo',
-                '-f', 'null',
-                '-'
-            ]
+            cmd = self._scene_cmd(video_path, threshold)
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            # Parse scene change timestamps from stderr
-            timestamps = self._parse_scene_timestamps(result.stderr)
+            # Parse scene change timestamps from stderr as FFmpeg writes it;
+            # the input banner also carries the duration, saving an ffprobe
+            timestamps, duration = self._parse_scene_output(self._iter_ffmpeg_stderr(cmd))
             
             # Convert timestamps to segments
             scenes = self._timestamps_to_scenes(
                 timestamps,
                 video_path,
-                min_scene_length
+                min_scene_length,
+                duration
             )
             
             if analyze_content and scenes:
@@ -87,7 +234,7 @@ class SceneDetector:
                         analyze_content = False
                 
                 if analyze_content:
-                    return self._analyze_scenes(video_path, scenes)
+                    return self._analyze_scenes(video_path, scenes, min_analysis_length)
             
             # Return basic scenes without analysis
             return [
@@ -106,45 +253,279 @@ class SceneDetector:
         except Exception as e:
             raise RuntimeError(f"Scene detection failed: {str(e)}")
     
-    def _parse_scene_timestamps(self, ffmpeg_output: str) -> List[float]:
-        """Parse scene change timestamps from FFmpeg output"""
+    def analyze(
+        self,
+        video_path: str,
+        threshold: float = 0.3,
+        min_scene_length: float = 2.0,
+        noise_threshold: str = "-30dB",
+        min_silence_duration: float = 1.0,
+        max_workers: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Run scene detection, silence detection and the duration probe at once
+        
+        Each pass is a separate FFmpeg/ffprobe process, so wall time is
+        the slowest pass rather than the sum. FFmpeg is multi-threaded
+        itself; lower max_workers instead of oversubscribing small machines.
+        
+        Args:
+            video_path: Path to video file
+            threshold: Scene change sensitivity (0.0-1.0)
+            min_scene_length: Minimum scene length in seconds
+            noise_threshold: Silence threshold (e.g., "-30dB")
+            min_silence_duration: Minimum silence length in seconds
+            max_workers: Passes allowed to run at the same time
+        
+        Returns:
+            Dict with 'scenes' and 'silences' as (start, end) lists and 'duration'
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                scene_future = executor.submit(
+                    lambda: self._parse_scene_output(
+                        self._iter_ffmpeg_stderr(self._scene_cmd(video_path, threshold))
+                    )
+                )
+                silence_future = executor.submit(
+                    lambda: self._parse_silence_timestamps(
+                        self._iter_ffmpeg_stderr(
+                            self._silence_cmd(video_path, noise_threshold, min_silence_duration)
+                        )
+                    )
+                )
+                duration_future = executor.submit(self._get_video_duration, video_path)
+                
+                timestamps, banner_duration = scene_future.result()
+                silences = silence_future.result()
+                duration = banner_duration or duration_future.result()
+        except Exception as e:
+            raise RuntimeError(f"Video analysis failed: {str(e)}")
+        
+        return {
+            'scenes': self._timestamps_to_scenes(
+                timestamps,
+                video_path,
+                min_scene_length,
+                duration
+            ),
+            'silences': silences,
+            'duration': duration
+        }
+    
+    @staticmethod
+    def _scene_filter(threshold: float) -> str:
+        """Filter logging frames past the scene change threshold"""
+        # Quoting the expression keeps its comma out of the filter chain
+        return f"select='gt(scene,{threshold})',showinfo"
+    
+    def _scene_cmd(self, video_path: str, threshold: float) -> List[str]:
+        """FFmpeg command logging frames past the scene change threshold"""
+        return [
+            self.ffmpeg_path,
+            '-i', video_path,
+            '-filter:v', self._scene_filter(threshold),
+            *self._NULL_OUTPUT
+        ]
+    
+    def _silence_cmd(
+        self,
+        video_path: str,
+        noise_threshold: str,
+        min_silence_duration: float
+    ) -> List[str]:
+        """FFmpeg command logging silent stretches of the audio"""
+        return [
+            self.ffmpeg_path,
+            '-i', video_path,
+            '-af', f'silencedetect=noise={noise_threshold}:d={min_silence_duration}',
+            *self._NULL_OUTPUT
+        ]
+    
+    def detect_scenes_and_silences(
+        self,
+        video_path: str,
+        threshold: float = 0.3,
+        min_scene_length: float = 2.0,
+        noise_threshold: str = "-30dB",
+        min_silence_duration: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        Detect scene changes and silences from a single FFmpeg decode
+        
+        One filter_complex feeds the video to the scene filter and the
+        audio to silencedetect. Videos without an audio stream fall back
+        to analyze().
+        
+        Returns:
+            Dict with 'scenes' and 'silences' as (start, end) lists and 'duration'
+        """
+        cmd = [
+            self.ffmpeg_path,
+            '-i', video_path,
+            '-filter_complex',
+            f'[0:v]{self._scene_filter(threshold)}[v];'
+            f'[0:a]silencedetect=noise={noise_threshold}:d={min_silence_duration}[a]',
+            '-map', '[v]',
+            '-map', '[a]',
+            *self._NULL_OUTPUT
+        ]
+        
+        timestamps = []
+        silences = []
+        silence_start = None
+        duration = None
+        
+        try:
+            for line in self._iter_ffmpeg_stderr(cmd, check=True):
+                if duration is None:
+                    duration = _parse_duration(line)
+                
+                _append_pts(timestamps, line)
+                
+                for m in _SILENCE_RE.finditer(line):
+                    if m.group(1) == b'start':
+                        silence_start = float(m.group(2))
+                    elif silence_start is not None:
+                        silences.append((silence_start, float(m.group(2))))
+                        silence_start = None
+        except subprocess.CalledProcessError:
+            # Most likely no audio stream for [0:a]
+            return self.analyze(
+                video_path,
+                threshold=threshold,
+                min_scene_length=min_scene_length,
+                noise_threshold=noise_threshold,
+                min_silence_duration=min_silence_duration
+            )
+        except Exception as e:
+            raise RuntimeError(f"Video analysis failed: {str(e)}")
+        
+        if duration is None:
+            duration = self._get_video_duration(video_path)
+        
+        return {
+            'scenes': self._timestamps_to_scenes(
+                timestamps,
+                video_path,
+                min_scene_length,
+                duration
+            ),
+            'silences': silences,
+            'duration': duration
+        }
+    
+    def _iter_ffmpeg_stderr(
+        self,
+        cmd: List[str],
+        timeout: float = 300,
+        check: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Run FFmpeg and yield its raw stderr lines as they are written
+        
+        Raises:
+            subprocess.TimeoutExpired: If FFmpeg runs longer than timeout
+            subprocess.CalledProcessError: If check is set and FFmpeg fails
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 16
+        )
+        timed_out = threading.Event()
+        
+        def kill():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            yield from proc.stderr
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.wait()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if check and proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+    
+    def _parse_scene_timestamps(
+        self,
+        ffmpeg_output: Union[str, bytes, Iterable[bytes]]
+    ) -> List[float]:
+        """Parse scene change timestamps from FFmpeg output or its byte lines"""
+        return self._parse_scene_output(ffmpeg_output)[0]
+    
+    def _parse_scene_output(
+        self,
+        ffmpeg_output: Union[str, bytes, Iterable[bytes]]
+    ) -> Tuple[List[float], Optional[float]]:
+        """
+        Parse scene change timestamps and input duration from FFmpeg output
+        
+        Returns:
+            (sorted timestamps, duration in seconds or None if not printed)
+        """
         timestamps = []
+        duration = None
         
-        for line in ffmpeg_output.split('\n'):
-            if 'pts_time:' in line:
-                try:
-                    # Extract timestamp
-                    parts = line.split('pts_time:')
-                    if len(parts) > 1:
-                        time_str = parts[1].split()[0]
-                        timestamp = float(time_str)
-                        timestamps.append(timestamp)
-                except:
-                    continue
+        for line in _output_lines(ffmpeg_output):
+            if duration is None:
+                duration = _parse_duration(line)
+            _append_pts(timestamps, line)
         
-        return sorted(set(timestamps))
+        return timestamps, duration
     
     def _timestamps_to_scenes(
         self,
         timestamps: List[float],
         video_path: str,
-        min_scene_length: float
+        min_scene_length: float,
+        duration: Optional[float] = None
     ) -> List[Tuple[float, float]]:
-        """Group timestamps into scene ranges with minimum length"""
-        """Convert scene change timestamps to scene ranges"""
+        """
+        Group sorted scene change timestamps into ranges of minimum length
+        
+        Each cut is found with a binary search from the previous one, so
+        changes too close to it are skipped without visiting them.
+        """
+        import numpy as np
+        
         if not timestamps:
             return []
         
-        # Get video duration
-        duration = self._get_video_duration(video_path)
+        # Get video duration unless the caller already knows it
+        if duration is None:
+            duration = self._get_video_duration(video_path)
         
+        ts = np.asarray(timestamps, dtype=np.float64)
+        n = len(ts)
         scenes = []
         start = 0.0
+        i = 0
         
-        for timestamp in timestamps:
-            if timestamp - start >= min_scene_length:
-                scenes.append((start, timestamp))
-                start = timestamp
+        while i < n:
+            lo = i
+            i = max(lo, int(np.searchsorted(ts, start + min_scene_length, side='left')))
+            # start + min can round either way; settle on the exact test
+            while i > lo and ts[i - 1] - start >= min_scene_length:
+                i -= 1
+            while i < n and ts[i] - start < min_scene_length:
+                i += 1
+            if i == n:
+                break
+            
+            timestamp = float(ts[i])
+            scenes.append((start, timestamp))
+            start = timestamp
+            i += 1
         
         # Add final scene
         if duration - start >= min_scene_length:
@@ -155,54 +536,32 @@ class SceneDetector:
     def _analyze_scenes(
         self,
         video_path: str,
-        scenes: List[Tuple[float, float]]
+        scenes: List[Tuple[float, float]],
+        min_analysis_length: float = 5.0
     ) -> List[SceneMetadata]:
         """Analyze scene content using ML models"""
         try:
-            cap = cv2.VideoCapture(video_path)
-            fps = cap.get(cv2.CAP_PROP_FPS)
+            scene_frames = self._sample_frames(
+                video_path,
+                scenes,
+                min_analysis_length=min_analysis_length
+            )
             analyzed_scenes = []
             
-            for start, end in scenes:
-                # Sample frames from scene
-                frame_times = np.linspace(start, end, num=5)  # 5 frames per scene
-                frames = []
-                
-                for t in frame_times:
-                    cap.set(cv2.CAP_PROP_POS_MSEC, t * 1000)
-                    ret, frame = cap.read()
-                    if ret:
-                        # Convert to RGB and resize
-                        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        frame = cv2.resize(frame, (224, 224))
-                        frames.append(frame)
-                
-                if frames:
-                    # Convert to tensor
-                    frames = torch.tensor(np.array(frames)).permute(0, 3, 1, 2)
-                    frames = frames.float() / 255.0
-                    frames = frames.to(self.ml_service.model_cache.device)
-                    
-                    # Get scene predictions
-                    with torch.no_grad():
-                        outputs = self.scene_model(frames)
-                        scene_logits = outputs.logits.mean(dim=0)
-                        scene_probs = torch.softmax(scene_logits, dim=-1)
-                    
-                    # Get top labels
-                    top_probs, top_indices = scene_probs.topk(3)
-                    labels = [
-                        self.scene_model.config.id2label[idx.item()]
-                        for idx in top_indices
-                    ]
-                    confidence = top_probs[0].item()
-                    
-                    # Analyze shot type
-                    shot_type = self._detect_shot_type(frames[len(frames)//2])
-                    
-                    # Calculate action/dialog scores
-                    action_score = self._calculate_motion(frames)
-                    dialog_score = self._estimate_dialog_probability(frames)
+            # Face and motion scoring is OpenCV/Numba work that releases the
+            # GIL, so it runs in threads while the classifier is busy
+            with ThreadPoolExecutor(max_workers=SCORING_WORKERS) as pool:
+                score_futures = [
+                    pool.submit(self._score_frames, frames) if len(frames) else None
+                    for frames in scene_frames
+                ]
+                predictions = self._classify_scenes(scene_frames)
+                scores = [f.result() if f else None for f in score_futures]
+            
+            for (start, end), prediction, score in zip(scenes, predictions, scores):
+                if prediction is not None:
+                    confidence, labels = prediction
+                    shot_type, action_score, dialog_score = score
                     
                     analyzed_scenes.append(SceneMetadata(
                         start_time=start,
@@ -225,7 +584,6 @@ class SceneDetector:
                         dialog_score=0.0
                     ))
             
-            cap.release()
             return analyzed_scenes
             
         except Exception as e:
@@ -244,18 +602,305 @@ class SceneDetector:
                 for start, end in scenes
             ]
     
-    def _detect_shot_type(self, frame: torch.Tensor) -> str:
-        """Detect shot type based on face detection and scene composition"""
+    def _score_frames(self, frames: np.ndarray) -> Tuple[str, float, float]:
+        """
+        Score one scene's frames on the CPU
+        
+        Returns:
+            (shot_type, action_score, dialog_score)
+        """
+        import cv2
+        import numpy as np
+        
+        # Faces in the middle frame feed both shot type and dialog
+        mid_frame = cv2.cvtColor(frames[len(frames)//2], cv2.COLOR_RGB2GRAY)
+        faces = self._detect_faces(mid_frame)
+        
+        # Analyze shot type
+        shot_type = self._detect_shot_type(mid_frame, faces)
+        
+        # Calculate action/dialog scores
+        action_score = self._calculate_motion(frames)
+        dialog_score = self._estimate_dialog_probability(mid_frame, faces)
+        
+        return shot_type, action_score, dialog_score
+    
+    def _classify_scenes(
+        self,
+        scene_frames: List[np.ndarray]
+    ) -> List[Optional[Tuple[float, List[str]]]]:
+        """
+        Classify all scenes with batched forward passes
+        
+        Frames from every scene go through the model together and the
+        logits are averaged back per scene.
+        
+        Returns:
+            Per scene, (confidence, top 3 labels), or None without frames
+        """
+        import torch
+        
+        counts = [len(frames) for frames in scene_frames]
+        if not any(counts):
+            return [None] * len(scene_frames)
+        
+        device = self.ml_service.model_cache.device
+        
+        # bf16 tensor cores where the GPU has them; full precision elsewhere
+        if device.type == 'cuda' and torch.cuda.is_bf16_supported():
+            autocast = torch.autocast('cuda', dtype=torch.bfloat16)
+        else:
+            autocast = contextlib.nullcontext()
+        
+        # Frames are gathered one batch at a time, so host memory stays
+        # bounded by CLASSIFY_BATCH_SIZE however many scenes there are
+        logits = []
+        with torch.inference_mode(), autocast:
+            for frames in _frame_batches(scene_frames, CLASSIFY_BATCH_SIZE):
+                chunk = torch.from_numpy(frames)
+                if device.type == 'cuda':
+                    chunk = chunk.pin_memory()
+                # Copy uint8 to the device and convert there: 4x less
+                # transfer. NHWC frames already are channels_last as NCHW
+                chunk = chunk.to(device, non_blocking=True).permute(0, 3, 1, 2)
+                chunk = chunk.float().div_(255.0).contiguous(memory_format=torch.channels_last)
+                logits.append(self.scene_model(chunk).logits.float())
+        logits = torch.cat(logits)
+        
+        scene_logits = []
+        offset = 0
+        for count in counts:
+            if count:
+                scene_logits.append(logits[offset:offset + count].mean(dim=0))
+            offset += count
+        
+        top_probs, top_indices = torch.stack(scene_logits).softmax(dim=-1).topk(3, dim=-1)
+        ranked = zip(top_probs.tolist(), top_indices.tolist())
+        
+        id2label = self.scene_model.config.id2label
+        predictions = []
+        for count in counts:
+            if count:
+                probs, indices = next(ranked)
+                predictions.append((probs[0], [id2label[idx] for idx in indices]))
+            else:
+                predictions.append(None)
+        
+        return predictions
+    
+    def _sample_frames(
+        self,
+        video_path: str,
+        scenes: List[Tuple[float, float]],
+        frames_per_scene: int = 5,
+        min_analysis_length: float = 0.0
+    ) -> List[np.ndarray]:
+        """
+        Decode sample frames for all scenes
+        
+        Samples come from each scene's keyframes, decoded without their
+        inter frames; scenes inside a single GOP fall back to evenly
+        spaced frames. Scenes shorter than min_analysis_length get only
+        their middle frame.
+        
+        Returns:
+            Per scene, an (N, FRAME_SIZE, FRAME_SIZE, 3) array of RGB frames
+        """
+        import numpy as np
+        
         try:
-            # Convert frame to numpy
-            frame = frame.cpu().numpy()
-            height, width = frame.shape[:2]
+            keyframes = self._keyframe_times(video_path)
+        except Exception as e:
+            logger.warning(f"Keyframe listing failed, sampling by time: {e}")
+            keyframes = []
+        
+        sample_times = []
+        for start, end in scenes:
+            in_scene = keyframes[
+                bisect.bisect_left(keyframes, start):bisect.bisect_left(keyframes, end)
+            ]
+            if end - start < min_analysis_length:
+                in_scene = in_scene[len(in_scene)//2:][:1]
+            elif len(in_scene) > frames_per_scene:
+                picks = np.linspace(0, len(in_scene) - 1, num=frames_per_scene).round()
+                in_scene = [in_scene[int(i)] for i in picks]
+            sample_times.append(in_scene)
+        
+        scene_frames = self._decode_frames_at(video_path, sample_times, keyframes_only=True)
+        
+        # GOPs longer than the scene leave it without keyframes
+        missing = [i for i, frames in enumerate(scene_frames) if not len(frames)]
+        if missing:
+            fallback = self._decode_frames_at(video_path, [
+                [sum(scenes[i]) / 2]
+                if scenes[i][1] - scenes[i][0] < min_analysis_length
+                else np.linspace(*scenes[i], num=frames_per_scene).tolist()
+                for i in missing
+            ])
+            for i, frames in zip(missing, fallback):
+                scene_frames[i] = frames
+        
+        return scene_frames
+    
+    def _keyframe_times(self, video_path: str) -> List[float]:
+        """
+        Sorted keyframe timestamps, read from packet flags without decoding
+        
+        Packet times keep the container's start offset while FFmpeg's
+        decode starts at zero, so the offset is subtracted.
+        """
+        result = subprocess.run(
+            [*_PROBE_KEYFRAMES_ARGS, video_path],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=60,
+            check=True
+        )
+        
+        times = []
+        start_time = 0.0
+        for line in result.stdout.splitlines():
+            section, _, fields = line.partition(',')
+            if section == 'packet':
+                pts_time, _, flags = fields.partition(',')
+                if 'K' in flags and pts_time not in ('', 'N/A'):
+                    times.append(float(pts_time))
+            elif section == 'format' and fields not in ('', 'N/A'):
+                start_time = float(fields)
+        
+        return sorted(t - start_time for t in times)
+    
+    def _decode_frames_at(
+        self,
+        video_path: str,
+        sample_times: List[List[float]],
+        keyframes_only: bool = False
+    ) -> List[np.ndarray]:
+        """
+        Decode the frames at the given times in a single FFmpeg pass
+        
+        One linear decode replaces a seek per sample; FFmpeg also does
+        the scaling and RGB conversion.
+        
+        Args:
+            video_path: Path to video file
+            sample_times: Per scene, the times to take frames at
+            keyframes_only: Have the decoder skip everything but keyframes
+        
+        Returns:
+            Per scene, an (N, FRAME_SIZE, FRAME_SIZE, 3) array holding the
+            first frame at or after each time (if any)
+        """
+        import numpy as np
+        
+        # Slack for timestamps that were printed rounded
+        eps = 1e-3
+        wanted = sorted({t for times in sample_times for t in times})
+        if not wanted:
+            empty = np.empty((0, FRAME_SIZE, FRAME_SIZE, 3), dtype=np.uint8)
+            return [empty for _ in sample_times]
+        
+        # Pick the first frame at or after each sample time
+        select = '+'.join(
+            f'gte(t\\,{t - eps})*not(gte(prev_pts*TB\\,{t - eps}))' for t in wanted
+        )
+        
+        # Each sample time selects at most one frame, so this is an upper
+        # bound; frames are read straight into it
+        frames = np.empty((len(wanted), FRAME_SIZE, FRAME_SIZE, 3), dtype=np.uint8)
+        frame_bytes = frames[0].nbytes
+        count = 0
+        
+        # The expression grows with every sample and would pass the OS
+        # limit on a single argument, so FFmpeg reads it from a file.
+        # showinfo logs each selected frame's timestamp to stderr; spool
+        # it to a file so a full stderr pipe can't stall the decode
+        with tempfile.TemporaryDirectory() as temp_dir, tempfile.TemporaryFile() as log:
+            script_path = os.path.join(temp_dir, 'filters.txt')
+            with open(script_path, 'w') as f:
+                f.write(f'select={select},showinfo,scale={FRAME_SIZE}:{FRAME_SIZE},format=rgb24')
+            
+            cmd = [self.ffmpeg_path, '-hide_banner', '-nostats']
+            if keyframes_only:
+                cmd.extend(['-skip_frame', 'nokey'])
+            cmd.extend([
+                '-i', video_path,
+                '-an',
+                '-filter_script:v', script_path,
+                '-vsync', '0',
+                '-f', 'rawvideo',
+                '-pix_fmt', 'rgb24',
+                'pipe:1'
+            ])
+            
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=log
+            )
+            try:
+                while count < len(frames):
+                    if proc.stdout.readinto(memoryview(frames[count]).cast('B')) < frame_bytes:
+                        break
+                    count += 1
+            finally:
+                proc.stdout.close()
+                proc.wait()
+            
+            # Stopping early once every frame is in closes the pipe on a
+            # running FFmpeg, so only a short read counts as a failure
+            if proc.returncode and count < len(frames):
+                log.seek(0)
+                raise subprocess.CalledProcessError(
+                    proc.returncode, cmd, stderr=log.read().decode(errors='replace')
+                )
             
-            # Run face detection
-            face_cascade = cv2.CascadeClassifier(
+            log.seek(0)
+            frame_times = [
+                float(line.split(b'pts_time:')[1].split()[0])
+                for line in log
+                if b'Parsed_showinfo' in line and b'pts_time:' in line
+            ]
+        
+        frame_times = frame_times[:count]
+        
+        scene_frames = []
+        for times in sample_times:
+            indices = [bisect.bisect_left(frame_times, t - eps) for t in times]
+            scene_frames.append(frames[[i for i in indices if i < len(frame_times)]])
+        
+        return scene_frames
+    
+    def _get_face_cascade(self) -> 'cv2.CascadeClassifier':
+        """Face detector, parsed from its XML once per scoring thread"""
+        cascade = getattr(self._face_cascades, 'cascade', None)
+        if cascade is None:
+            import cv2
+            cascade = cv2.CascadeClassifier(
                 cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
             )
-            faces = face_cascade.detectMultiScale(frame, 1.1, 4)
+            self._face_cascades.cascade = cascade
+        return cascade
+    
+    def _detect_faces(self, frame: np.ndarray) -> np.ndarray:
+        """Detect faces in a grayscale frame as (x, y, w, h) rows"""
+        import cv2
+        import numpy as np
+        
+        try:
+            return self._get_face_cascade().detectMultiScale(frame, 1.1, 4)
+        except cv2.error:
+            return np.empty((0, 4), dtype=np.int32)
+    
+    def _detect_shot_type(self, frame: np.ndarray, faces: np.ndarray) -> str:
+        """Detect shot type based on face detection and scene composition"""
+        import cv2
+        import numpy as np
+        
+        try:
+            height, width = frame.shape[:2]
             
             if len(faces) > 0:
                 # Use largest face for shot type
@@ -280,38 +925,23 @@ class SceneDetector:
         except:
             return "unknown"
     
-    def _calculate_motion(self, frames: torch.Tensor) -> float:
-        """Calculate motion intensity score"""
+    def _calculate_motion(self, frames: np.ndarray) -> float:
+        """Calculate motion intensity score from (N, H, W, C) uint8 frames"""
         try:
             if len(frames) < 2:
                 return 0.0
             
-            diffs = []
-            frames_np = frames.cpu().numpy()
-            
-            for i in range(len(frames_np) - 1):
-                # Calculate frame difference
-                diff = np.abs(frames_np[i+1] - frames_np[i]).mean()
-                diffs.append(diff)
-            
             # Normalize motion score
-            motion_score = np.mean(diffs)
+            motion_score = _motion_kernel()(frames)
             return float(min(motion_score * 5, 1.0))  # Scale up and cap
-        except:
+        except Exception:
             return 0.0
     
-    def _estimate_dialog_probability(self, frames: torch.Tensor) -> float:
+    def _estimate_dialog_probability(self, mid_frame: np.ndarray, faces: np.ndarray) -> float:
         """Estimate probability of dialog scene"""
+        import numpy as np
+        
         try:
-            # Convert middle frame to numpy
-            mid_frame = frames[len(frames)//2].cpu().numpy()
-            
-            # Run face detection
-            face_cascade = cv2.CascadeClassifier(
-                cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-            )
-            faces = face_cascade.detectMultiScale(mid_frame, 1.1, 4)
-            
             # Dialog probability based on:
             # - Number of faces (1-2 faces typical for dialog)
             # - Face sizes (medium shots typical)
@@ -348,22 +978,8 @@ class SceneDetector:
     def _get_video_duration(self, video_path: str) -> float:
         """Get video duration"""
         try:
-            cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                video_path
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            return float(result.stdout.strip())
+            st = os.stat(video_path)
+            return _probe_duration(video_path, st.st_mtime_ns, st.st_size)
         except:
             return 3600.0  # Default fallback
     
@@ -409,50 +1025,31 @@ class SceneDetector:
             List of (start, end) tuples for silent portions
         """
         try:
-            cmd = [
-                self.ffmpeg_path,
-                '-i', video_path,
-                '-af', f'silencedetect=noise={noise_threshold}:d={min_silence_duration}',
-                '-f', 'null',
-                '-'
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            cmd = self._silence_cmd(video_path, noise_threshold, min_silence_duration)
             
-            # Parse silence timestamps
-            silences = self._parse_silence_timestamps(result.stderr)
+            # Parse silence timestamps as FFmpeg writes them
+            silences = self._parse_silence_timestamps(self._iter_ffmpeg_stderr(cmd))
             
             return silences
             
         except Exception as e:
             raise RuntimeError(f"Silence detection failed: {str(e)}")
     
-    def _parse_silence_timestamps(self, ffmpeg_output: str) -> List[Tuple[float, float]]:
-        """Parse silence start/end timestamps"""
+    def _parse_silence_timestamps(
+        self,
+        ffmpeg_output: Union[str, bytes, Iterable[bytes]]
+    ) -> List[Tuple[float, float]]:
+        """Parse silence start/end timestamps from FFmpeg output or its byte lines"""
         silences = []
         silence_start = None
         
-        for line in ffmpeg_output.split('\n'):
-            if 'silence_start:' in line:
-                try:
-                    parts = line.split('silence_start:')
-                    silence_start = float(parts[1].strip())
-                except:
-                    continue
-            
-            elif 'silence_end:' in line and silence_start is not None:
-                try:
-                    parts = line.split('silence_end:')
-                    silence_end = float(parts[1].split('|')[0].strip())
-                    silences.append((silence_start, silence_end))
+        for line in _output_lines(ffmpeg_output):
+            for m in _SILENCE_RE.finditer(line):
+                if m.group(1) == b'start':
+                    silence_start = float(m.group(2))
+                elif silence_start is not None:
+                    silences.append((silence_start, float(m.group(2))))
                     silence_start = None
-                except:
-                    continue
         
         return silences
     
@@ -1,11 +1,13 @@
 """
 Segment model with validation and serialization
 """
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
+from utils.compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Segment:
     """Represents a video segment with validation"""
     
@@ -15,6 +17,8 @@ class Segment:
     color: str = "#009682"
     export_video: bool = True
     export_audio: bool = True
+    # Scene analysis details, attached by scene detection; not serialized
+    metadata: Optional[Dict[str, Any]] = field(default=None, compare=False)
     
     def __post_init__(self):
         """Validate segment after initialization"""
@@ -66,4 +70,41 @@ class Segment:
         )
     
     def __repr__(self) -> str:
-        return f"Segment('{self.label}', {self.start:.2f}s-{self.end:.2f}s)"
\ No newline at end of file
+        return f"Segment('{self.label}', {self.start:.2f}s-{self.end:.2f}s)"
+
+
+def find_overlaps(segments: Sequence[Segment]) -> List[Tuple[int, int]]:
+    """
+    Find every overlapping pair of segments
+    
+    Sorts by start and, for each segment, binary-searches the later
+    starts that fall before its end: O(N log N + overlaps) instead of
+    calling overlaps_with on every pair.
+    
+    Returns:
+        (i, j) index pairs into segments with i < j, in sorted order
+    """
+    count = len(segments)
+    if count < 2:
+        return []
+    
+    import numpy as np
+    
+    starts = np.fromiter((s.start for s in segments), dtype=np.float64, count=count)
+    ends = np.fromiter((s.end for s in segments), dtype=np.float64, count=count)
+    
+    order = np.argsort(starts, kind='stable')
+    sorted_starts = starts[order]
+    # Segments sorted after position k that start before its end
+    stops = np.searchsorted(sorted_starts, ends[order], side='left')
+    
+    pairs = []
+    for k in np.flatnonzero(stops > np.arange(1, count + 1)).tolist():
+        i = int(order[k])
+        for j in order[k + 1:stops[k]].tolist():
+            # Same test as overlaps_with, for zero-length or inverted segments
+            if ends[j] > starts[i]:
+                pairs.append((i, j) if i < j else (j, i))
+    
+    pairs.sort()
+    return pairs
@@ -1,13 +1,21 @@
 """
 Professional undo/redo system with command pattern
 """
-from typing import List, Optional, Any, Callable
+import sys
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional, Any, Callable, Iterable, Iterator, FrozenSet, Tuple
 from abc import ABC, abstractmethod
 
 
 class Command(ABC):
     """Abstract command for undo/redo operations"""
     
+    # Subclasses list their own slots; history can hold many commands
+    __slots__ = ()
+    
     @abstractmethod
     def execute(self) -> None:
         """Execute the command"""
@@ -22,52 +30,92 @@ class Command(ABC):
     def description(self) -> str:
         """Get command description for UI"""
         pass
+    
+    def _segment_description(self, text: str, **fields: Any) -> str:
+        """
+        Description naming the command's segment, rebuilt only on rename
+        
+        Args:
+            text: Format string with a {label} field
+            fields: Other fields in text
+        """
+        label = self.segment.label
+        if self._description is None or label is not self._label:
+            self._label = label
+            self._description = text.format(label=label, **fields)
+        return self._description
+    
+    def approx_size(self) -> int:
+        """Rough bytes held by the command, for the history memory cap"""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(getattr(self, 'old_value', None))
+            + sys.getsizeof(getattr(self, 'new_value', None))
+        )
 
 
 class AddSegmentCommand(Command):
     """Command to add a segment"""
     
+    __slots__ = ('segment_list', 'segment', 'index', '_label', '_description')
+    
     def __init__(self, segment_list: List, segment: Any):
         self.segment_list = segment_list
         self.segment = segment
+        self.index = -1
+        self._label = None
+        self._description = None
     
     def execute(self) -> None:
+        self.index = len(self.segment_list)
         self.segment_list.append(self.segment)
     
     def undo(self) -> None:
-        self.segment_list.remove(self.segment)
+        # Later commands are undone first, so the segment is back at index
+        del self.segment_list[self.index]
     
     def description(self) -> str:
-        return f"Add '{self.segment.label}'"
+        return self._segment_description("Add '{label}'")
 
 
 class RemoveSegmentCommand(Command):
     """Command to remove a segment"""
     
-    def __init__(self, segment_list: List, segment: Any):
+    __slots__ = ('segment_list', 'segment', 'index', '_label', '_description')
+    
+    def __init__(self, segment_list: List, segment: Any, index: Optional[int] = None):
         self.segment_list = segment_list
         self.segment = segment
-        self.index = -1
+        # Callers usually know the row; otherwise it's looked up once
+        self.index = index
+        self._label = None
+        self._description = None
     
     def execute(self) -> None:
-        self.index = self.segment_list.index(self.segment)
-        self.segment_list.remove(self.segment)
+        if self.index is None:
+            self.index = self.segment_list.index(self.segment)
+        del self.segment_list[self.index]
     
     def undo(self) -> None:
         self.segment_list.insert(self.index, self.segment)
     
     def description(self) -> str:
-        return f"Remove '{self.segment.label}'"
+        return self._segment_description("Remove '{label}'")
 
 
 class ModifySegmentCommand(Command):
     """Command to modify a segment"""
     
+    __slots__ = ('segment', 'attr', 'old_value', 'new_value', '_label', '_description')
+    
     def __init__(self, segment: Any, attr: str, old_value: Any, new_value: Any):
         self.segment = segment
-        self.attr = attr
+        # Interned so coalescing compares attribute names by identity
+        self.attr = sys.intern(attr)
         self.old_value = old_value
         self.new_value = new_value
+        self._label = None
+        self._description = None
     
     def execute(self) -> None:
         setattr(self.segment, self.attr, self.new_value)
@@ -76,15 +124,17 @@ class ModifySegmentCommand(Command):
         setattr(self.segment, self.attr, self.old_value)
     
     def description(self) -> str:
-        return f"Modify '{self.segment.label}' {self.attr}"
+        return self._segment_description("Modify '{label}' {attr}", attr=self.attr)
 
 
 class BatchCommand(Command):
     """Execute multiple commands as one"""
     
+    __slots__ = ('commands', 'desc')
+    
     def __init__(self, commands: List[Command], desc: str = "Batch operation"):
         self.commands = commands
-        self.desc = desc
+        self.desc = sys.intern(desc)
     
     def execute(self) -> None:
         for cmd in self.commands:
@@ -96,48 +146,152 @@ class BatchCommand(Command):
     
     def description(self) -> str:
         return self.desc
+    
+    def approx_size(self) -> int:
+        return sys.getsizeof(self) + sum(cmd.approx_size() for cmd in self.commands)
 
 
 class UndoManager:
-    """Manages undo/redo history"""
+    """
+    Manages undo/redo history
+    
+    Mutations hold a lock so a background reader (e.g. autosave) never
+    sees a half-applied change; reads only hold it long enough to copy
+    what they need. Callbacks run after the lock is released.
+    """
+    
+    # Once over max_memory_bytes, purge the oldest commands down to this share
+    PURGE_RATIO = 0.8
     
-    def __init__(self, max_history: int = 100):
+    # State observers can filter on, in _state() order
+    STATE_FIELDS = ('can_undo', 'can_redo', 'undo_description', 'redo_description')
+    
+    def __init__(
+        self,
+        max_history: int = 100,
+        max_memory_bytes: int = 256 * 1024 * 1024,
+        coalesce_window_ms: int = 500
+    ):
         self.max_history = max_history
-        self._undo_stack: List[Command] = []
-        self._redo_stack: List[Command] = []
-        self._callbacks: List[Callable] = []
+        self.max_memory_bytes = max_memory_bytes
+        # Edits of the same segment attribute this close together merge
+        self.coalesce_window_ms = coalesce_window_ms
+        self._last_push_time = 0.0
+        # Commands collected between begin_transaction() and end_transaction()
+        self._transaction: Optional[List[Command]] = None
+        self._transaction_desc = ""
+        # Estimated size of everything on both stacks
+        self._current_bytes = 0
+        # Bounded deques drop the oldest command in O(1) once full
+        self._undo_stack: Deque[Command] = deque(maxlen=max_history)
+        self._redo_stack: Deque[Command] = deque(maxlen=max_history)
+        self._callbacks: List[Tuple[Callable, Optional[FrozenSet[str]]]] = []
+        self._lock = threading.RLock()
+        self._last_state = self._state()
     
     def execute(self, command: Command) -> None:
         """Execute a command and add to history"""
-        command.execute()
+        with self._lock:
+            command.execute()
+            
+            if self._transaction is not None:
+                self._transaction.append(command)
+                return
+            
+            if not self._coalesce(command):
+                self._push(command)
+        
+        self._notify_change()
+    
+    def begin_transaction(self, desc: str = "Batch operation") -> None:
+        """Group the following commands into one undo entry"""
+        with self._lock:
+            if self._transaction is None:
+                self._transaction = []
+                self._transaction_desc = desc
+    
+    def end_transaction(self) -> None:
+        """Close the current transaction; later edits never merge into it"""
+        with self._lock:
+            commands, self._transaction = self._transaction, None
+            if commands:
+                self._push(BatchCommand(commands, self._transaction_desc))
+            self._last_push_time = 0.0
+        
+        self._notify_change()
+    
+    def _coalesce(self, command: Command) -> bool:
+        """Fold a repeated segment edit into the previous one, if recent"""
+        now = time.monotonic()
+        recent = (now - self._last_push_time) * 1000 < self.coalesce_window_ms
+        
+        top = self._undo_stack[-1] if self._undo_stack else None
+        if not (
+            recent
+            and not self._redo_stack
+            and isinstance(command, ModifySegmentCommand)
+            and isinstance(top, ModifySegmentCommand)
+            and top.segment is command.segment
+            and top.attr == command.attr
+        ):
+            return False
+        
+        # Keep the original old_value so one undo reverts the whole gesture
+        self._current_bytes -= top.approx_size()
+        top.new_value = command.new_value
+        self._current_bytes += top.approx_size()
+        self._last_push_time = now
+        return True
+    
+    def _push(self, command: Command) -> None:
+        """Add an executed command to history; caller holds the lock"""
+        # A full deque drops its oldest command on append
+        if len(self._undo_stack) == self._undo_stack.maxlen:
+            self._current_bytes -= self._undo_stack[0].approx_size()
         self._undo_stack.append(command)
+        self._current_bytes += command.approx_size()
+        
+        self._current_bytes -= sum(cmd.approx_size() for cmd in self._redo_stack)
         self._redo_stack.clear()
         
-        # Limit history size
-        if len(self._undo_stack) > self.max_history:
-            self._undo_stack.pop(0)
+        self._last_push_time = time.monotonic()
+        self._purge_memory()
+    
+    def _purge_memory(self) -> None:
+        """Drop the oldest undo commands while history is over its memory cap"""
+        if self._current_bytes <= self.max_memory_bytes:
+            return
         
-        self._notify_change()
+        # Always keep the command that was just executed
+        target = self.max_memory_bytes * self.PURGE_RATIO
+        while self._current_bytes > target and len(self._undo_stack) > 1:
+            self._current_bytes -= self._undo_stack.popleft().approx_size()
     
     def undo(self) -> bool:
         """Undo last command"""
-        if not self.can_undo():
-            return False
+        with self._lock:
+            if not self.can_undo():
+                return False
+            
+            command = self._undo_stack.pop()
+            command.undo()
+            self._redo_stack.append(command)
+            self._last_push_time = 0.0
         
-        command = self._undo_stack.pop()
-        command.undo()
-        self._redo_stack.append(command)
         self._notify_change()
         return True
     
     def redo(self) -> bool:
         """Redo last undone command"""
-        if not self.can_redo():
-            return False
+        with self._lock:
+            if not self.can_redo():
+                return False
+            
+            command = self._redo_stack.pop()
+            command.execute()
+            self._undo_stack.append(command)
+            self._last_push_time = 0.0
         
-        command = self._redo_stack.pop()
-        command.execute()
-        self._undo_stack.append(command)
         self._notify_change()
         return True
     
@@ -151,31 +305,84 @@ class UndoManager:
     
     def get_undo_description(self) -> Optional[str]:
         """Get description of next undo operation"""
-        if not self.can_undo():
-            return None
-        return self._undo_stack[-1].description()
+        with self._lock:
+            top = self._undo_stack[-1] if self._undo_stack else None
+        return top.description() if top is not None else None
     
     def get_redo_description(self) -> Optional[str]:
         """Get description of next redo operation"""
-        if not self.can_redo():
-            return None
-        return self._redo_stack[-1].description()
+        with self._lock:
+            top = self._redo_stack[-1] if self._redo_stack else None
+        return top.description() if top is not None else None
     
     def clear(self) -> None:
         """Clear all history"""
-        self._undo_stack.clear()
-        self._redo_stack.clear()
+        with self._lock:
+            self._undo_stack.clear()
+            self._redo_stack.clear()
+            self._current_bytes = 0
+        
         self._notify_change()
     
-    def add_callback(self, callback: Callable) -> None:
-        """Add callback for state changes"""
-        self._callbacks.append(callback)
+    def add_callback(self, callback: Callable, mask: Optional[Iterable[str]] = None) -> None:
+        """
+        Add callback for state changes
+        
+        Args:
+            callback: Called without arguments after a change
+            mask: STATE_FIELDS the callback cares about; None for any
+        """
+        with self._lock:
+            self._callbacks.append((callback, frozenset(mask) if mask is not None else None))
+    
+    def _state(self) -> Tuple[bool, bool, Optional[str], Optional[str]]:
+        """Observable state, matching STATE_FIELDS"""
+        return (
+            self.can_undo(),
+            self.can_redo(),
+            self.get_undo_description(),
+            self.get_redo_description()
+        )
     
     def _notify_change(self) -> None:
-        """Notify callbacks of state change"""
-        for callback in self._callbacks:
-            callback()
+        """Notify callbacks whose part of the state changed"""
+        with self._lock:
+            state = self._state()
+            if state == self._last_state:
+                return
+            
+            changed = {
+                name
+                for name, old, new in zip(self.STATE_FIELDS, self._last_state, state)
+                if old != new
+            }
+            self._last_state = state
+            callbacks = list(self._callbacks)
+        
+        for callback, mask in callbacks:
+            if mask is None or not mask.isdisjoint(changed):
+                callback()
     
-    def get_history(self) -> List[str]:
-        """Get list of undo history descriptions"""
-        return [cmd.description() for cmd in self._undo_stack]
\ No newline at end of file
+    def get_history(self, limit: Optional[int] = None) -> List[str]:
+        """
+        Get list of undo history descriptions, oldest first
+        
+        Args:
+            limit: Only describe the most recent this many commands
+        """
+        with self._lock:
+            if limit is None:
+                snapshot = list(self._undo_stack)
+            else:
+                snapshot = list(islice(reversed(self._undo_stack), limit))
+                snapshot.reverse()
+        
+        return [cmd.description() for cmd in snapshot]
+    
+    def iter_history(self) -> Iterator[str]:
+        """Lazily yield undo history descriptions, most recent first"""
+        with self._lock:
+            snapshot = list(self._undo_stack)
+        
+        for cmd in reversed(snapshot):
+            yield cmd.description()
\ No newline at end of file
@@ -1,17 +1,24 @@
 """
 High-level video processing engine
 """
+import asyncio
 import os
+import tempfile
+import time
 from pathlib import Path
-from typing import List, Optional, Callable, Dict, Any
+from typing import List, Optional, Callable, Dict, Any, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from core.segment import Segment
+from core.segment import Segment, find_overlaps
+from utils.compat import DATACLASS_SLOTS
 from utils.ffmpeg_wrapper import FFmpegWrapper
 
 
-@dataclass
+# Characters not allowed in filenames, mapped to '_'
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingOptions:
     """Options for video processing"""
     # Basic options
@@ -55,7 +62,7 @@ class ProcessingOptions:
             self.extra_args = []
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingResult:
     """Result of processing a segment"""
     segment: Segment
@@ -68,12 +75,24 @@ class ProcessingResult:
 class VideoEngine:
     """Main video processing engine"""
     
+    # Seconds a stream-copied part may run past its segment's end, i.e.
+    # how far past a cut point the next keyframe may be
+    COPY_CUT_TOLERANCE = 2.0
+    
+    # Share of the video the segments must cover for one split run over
+    # the whole file to beat cutting them one by one; the split also
+    # writes out every gap between segments
+    COPY_SPLIT_MIN_COVERAGE = 0.5
+    
     def __init__(self):
         self.ffmpeg = FFmpegWrapper()
         self.current_video: Optional[str] = None
         self.video_info: Optional[Dict[str, Any]] = None
         self._progress_callback: Optional[Callable] = None
         self._cancel_requested = False
+        self._audio_export_options: Optional[ProcessingOptions] = None
+        # output_dir plus separator; output paths are this + file name
+        self._output_prefix = ""
     
     def load_video(self, file_path: str) -> Dict[str, Any]:
         """
@@ -102,6 +121,11 @@ class VideoEngine:
         errors = []
         duration = self.video_info['duration']
         
+        # Overlapping partners of each segment, found in one sweep
+        overlaps: Dict[int, List[int]] = {}
+        for i, j in find_overlaps(segments):
+            overlaps.setdefault(i, []).append(j)
+        
         for i, segment in enumerate(segments):
             # Check individual segment validity
             try:
@@ -117,12 +141,11 @@ class VideoEngine:
                 )
             
             # Check for overlaps
-            for j, other in enumerate(segments[i+1:], start=i+1):
-                if segment.overlaps_with(other):
-                    errors.append(
-                        f"Segments {i+1} and {j+1} overlap: "
-                        f"'{segment.label}' and '{other.label}'"
-                    )
+            for j in overlaps.get(i, ()):
+                errors.append(
+                    f"Segments {i+1} and {j+1} overlap: "
+                    f"'{segment.label}' and '{segments[j].label}'"
+                )
         
         return errors
     
@@ -158,6 +181,9 @@ class VideoEngine:
         
         self._progress_callback = progress_callback
         self._cancel_requested = False
+        # Every MP3 export in this run shares one set of options
+        self._audio_export_options = self._audio_options(options)
+        self._output_prefix = os.path.join(output_dir, "")
         
         results = []
         
@@ -168,6 +194,163 @@ class VideoEngine:
         
         return results
     
+    def process_segments_copy_fast(
+        self,
+        segments: List[Segment],
+        output_dir: str,
+        options: ProcessingOptions,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> List[ProcessingResult]:
+        """
+        Process stream-copy segments with a single ffmpeg run
+        
+        Cuts the whole video at every segment boundary with the segment
+        muxer, keeps the parts that match a segment and drops the gaps.
+        When the segments cover less than COPY_SPLIT_MIN_COVERAGE of the
+        video, they're cut one by one instead. Audio exports still go
+        through the regular per-segment path.
+        
+        Args:
+            segments: List of segments to process
+            output_dir: Output directory
+            options: Processing options (codec_copy must be set)
+            progress_callback: Callback(current, total, message)
+        
+        Returns:
+            List of processing results
+        """
+        if not options.codec_copy:
+            return self.process_segments(segments, output_dir, options, progress_callback)
+        
+        if not self.current_video:
+            raise RuntimeError("No video loaded")
+        
+        errors = self.validate_segments(segments)
+        if errors:
+            raise ValueError(f"Validation failed:\n" + "\n".join(errors))
+        
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        
+        self._progress_callback = progress_callback
+        self._cancel_requested = False
+        # Every MP3 export in this run shares one set of options
+        self._audio_export_options = self._audio_options(options)
+        self._output_prefix = os.path.join(output_dir, "")
+        
+        total = len(segments)
+        video_segments = [s for s in segments if s.export_video]
+        # Segments whose part from the split can't be used; cut one by one
+        unsplit = set()
+        split_time = 0.0
+        
+        if video_segments and (
+            sum(s.duration for s in video_segments)
+            < self.video_info['duration'] * self.COPY_SPLIT_MIN_COVERAGE
+        ):
+            unsplit = {id(s) for s in video_segments}
+        elif video_segments:
+            cut_points = sorted(
+                {s.start for s in video_segments if s.start > 0}
+                | {s.end for s in video_segments}
+            )
+        
+            start_time = time.time()
+            # Parts land next to the outputs so the final rename stays on one filesystem
+            with tempfile.TemporaryDirectory(dir=output_dir) as parts_dir:
+                try:
+                    parts = self.ffmpeg.split_copy(
+                        self.current_video,
+                        os.path.join(parts_dir, f"part_%04d.{options.output_format}"),
+                        cut_points,
+                        os.path.join(parts_dir, "parts.csv"),
+                        options
+                    )
+                except Exception:
+                    parts = []
+        
+                claimed = set()
+                for segment in video_segments:
+                    part = self._part_for_segment(parts, segment, claimed)
+                    if part is None:
+                        unsplit.add(id(segment))
+                        continue
+                    claimed.add(part)
+                    os.replace(
+                        part,
+                        f"{self._output_prefix}{self._base_name(segment)}.{options.output_format}"
+                    )
+            split_time = time.time() - start_time
+        
+        results = []
+        for i, segment in enumerate(segments, 1):
+            if self._cancel_requested:
+                break
+        
+            start_time = time.time()
+            error = None
+        
+            if id(segment) in unsplit:
+                try:
+                    self.ffmpeg.extract_clip(
+                        self.current_video,
+                        f"{self._output_prefix}{self._base_name(segment)}.{options.output_format}",
+                        segment.start,
+                        segment.end,
+                        options
+                    )
+                except Exception as e:
+                    error = str(e)
+        
+            if error is None and (segment.export_audio or options.export_both_formats):
+                try:
+                    self._export_audio(segment, self._base_name(segment))
+                except Exception as e:
+                    error = str(e)
+        
+            processing_time = time.time() - start_time
+            if segment.export_video:
+                processing_time += split_time / len(video_segments)
+        
+            results.append(ProcessingResult(
+                segment=segment,
+                success=error is None,
+                output_path=output_dir if error is None else None,
+                error=error,
+                processing_time=processing_time
+            ))
+        
+            if self._progress_callback:
+                self._progress_callback(i, total, f"Completed: {segment.label}")
+        
+        return results
+    
+    def _part_for_segment(
+        self,
+        parts: List[Tuple[str, float, float]],
+        segment: Segment,
+        claimed: set
+    ) -> Optional[str]:
+        """
+        The unclaimed split part holding just this segment, if there is one
+        
+        Part boundaries are keyframes. The part must start exactly at the
+        segment, so no content is lost, and end at or after it, at most
+        COPY_CUT_TOLERANCE late. A segment starting between keyframes has
+        no such part and is cut on its own.
+        """
+        eps = 1e-3
+        for path, start, end in parts:
+            if start < segment.start - eps:
+                continue
+            if (
+                path not in claimed
+                and start <= segment.start + eps
+                and segment.end - eps <= end <= segment.end + self.COPY_CUT_TOLERANCE
+            ):
+                return path
+            return None
+        return None
+    
     def _process_sequential(
         self,
         segments: List[Segment],
@@ -197,44 +380,55 @@ class VideoEngine:
         options: ProcessingOptions
     ) -> List[ProcessingResult]:
         """Process segments in parallel"""
-        results = []
+        return asyncio.run(self._process_parallel_async(segments, output_dir, options))
+    
+    async def _process_parallel_async(
+        self,
+        segments: List[Segment],
+        output_dir: str,
+        options: ProcessingOptions
+    ) -> List[ProcessingResult]:
+        """
+        Run up to max_workers FFmpeg processes at once from one event loop
+        
+        The work happens in the child processes, so no worker threads are
+        needed. On cancellation the unfinished tasks are cancelled, which
+        kills their FFmpeg processes.
+        """
         total = len(segments)
         completed = 0
         
-        with ThreadPoolExecutor(max_workers=options.max_workers) as executor:
-            # Submit all tasks
-            future_to_segment = {
-                executor.submit(
-                    self._process_single_segment,
-                    segment,
-                    output_dir,
-                    options
-                ): segment
-                for segment in segments
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_segment):
-                if self._cancel_requested:
-                    executor.shutdown(wait=False)
-                    break
-                
-                result = future.result()
-                results.append(result)
-                
-                completed += 1
-                if self._progress_callback:
-                    self._progress_callback(
-                        completed,
-                        total,
-                        f"Completed: {result.segment.label}"
-                    )
+        limit = asyncio.Semaphore(max(1, options.max_workers))
+        tasks = [
+            asyncio.create_task(
+                self._process_single_segment_async(segment, output_dir, options, limit)
+            )
+            for segment in segments
+        ]
         
-        # Sort results by original segment order
-        segment_order = {id(s): i for i, s in enumerate(segments)}
-        results.sort(key=lambda r: segment_order.get(id(r.segment), 0))
+        pending = set(tasks)
+        try:
+            # Report progress as tasks complete
+            while pending and not self._cancel_requested:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    completed += 1
+                    if self._progress_callback:
+                        self._progress_callback(
+                            completed,
+                            total,
+                            f"Completed: {task.result().segment.label}"
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
         
-        return results
+        # Tasks were created in segment order, so no sort is needed
+        return [task.result() for task in tasks if not task.cancelled()]
     
     def _process_single_segment(
         self,
@@ -243,53 +437,16 @@ class VideoEngine:
         options: ProcessingOptions
     ) -> ProcessingResult:
         """Process a single segment"""
-        import time
         start_time = time.time()
         
         try:
-            # Sanitize filename
-            safe_label = self._sanitize_filename(segment.label)
-            base_name = f"{safe_label}_{int(segment.start)}_{int(segment.end)}"
-            
-            # Export video if requested
-            if segment.export_video:
-                video_path = os.path.join(
-                    output_dir,
-                    f"{base_name}.{options.output_format}"
-                )
-                
-                # Extract video with full processing options
-                self.ffmpeg.extract_clip(
-                    self.current_video,
-                    video_path,
-                    segment.start,
-                    segment.end,
-                    options
-                )
-            
-            # Export audio if requested OR if export_both_formats is enabled
-            if segment.export_audio or options.export_both_formats:
-                audio_path = os.path.join(output_dir, f"{base_name}.mp3")
-                
-                # For audio-only export, create optimized MP3 options
-                audio_options = ProcessingOptions(
-                    output_format="mp3",
-                    codec_copy=False,
-                    video_codec=None,
-                    audio_codec="libmp3lame",
-                    audio_channels=options.audio_channels,
-                    audio_sample_rate=options.audio_sample_rate,
-                    normalize_audio=options.normalize_audio,
-                    mp3_quality=options.mp3_quality,
-                    extra_args=["-q:a", str(options.mp3_quality)]  # Variable bitrate quality
-                )
-                
+            for output_path, clip_options in self._segment_clips(segment, options):
                 self.ffmpeg.extract_clip(
                     self.current_video,
-                    audio_path,
+                    output_path,
                     segment.start,
                     segment.end,
-                    audio_options
+                    clip_options
                 )
             
             processing_time = time.time() - start_time
@@ -311,12 +468,110 @@ class VideoEngine:
                 processing_time=processing_time
             )
     
+    async def _process_single_segment_async(
+        self,
+        segment: Segment,
+        output_dir: str,
+        options: ProcessingOptions,
+        limit: asyncio.Semaphore
+    ) -> ProcessingResult:
+        """Process a single segment once a worker slot is free"""
+        async with limit:
+            start_time = time.time()
+            
+            try:
+                for output_path, clip_options in self._segment_clips(segment, options):
+                    await self.ffmpeg.extract_clip_async(
+                        self.current_video,
+                        output_path,
+                        segment.start,
+                        segment.end,
+                        clip_options
+                    )
+                
+                processing_time = time.time() - start_time
+                
+                return ProcessingResult(
+                    segment=segment,
+                    success=True,
+                    output_path=output_dir,
+                    processing_time=processing_time
+                )
+                
+            except Exception as e:
+                processing_time = time.time() - start_time
+                
+                return ProcessingResult(
+                    segment=segment,
+                    success=False,
+                    error=str(e),
+                    processing_time=processing_time
+                )
+    
+    def _segment_clips(
+        self,
+        segment: Segment,
+        options: ProcessingOptions
+    ) -> List[Tuple[str, ProcessingOptions]]:
+        """(output path, options) for each file a segment exports"""
+        base_name = self._base_name(segment)
+        clips = []
+        
+        # Export video if requested
+        if segment.export_video:
+            clips.append((
+                f"{self._output_prefix}{base_name}.{options.output_format}",
+                options
+            ))
+        
+        # Export audio if requested OR if export_both_formats is enabled
+        if segment.export_audio or options.export_both_formats:
+            clips.append((
+                f"{self._output_prefix}{base_name}.mp3",
+                self._audio_export_options
+            ))
+        
+        return clips
+    
+    def _base_name(self, segment: Segment) -> str:
+        """Output file stem for a segment"""
+        safe_label = self._sanitize_filename(segment.label)
+        return f"{safe_label}_{int(segment.start)}_{int(segment.end)}"
+    
+    def _export_audio(
+        self,
+        segment: Segment,
+        base_name: str
+    ) -> None:
+        """Export a segment's audio as MP3 with this run's audio options"""
+        audio_path = f"{self._output_prefix}{base_name}.mp3"
+        
+        self.ffmpeg.extract_clip(
+            self.current_video,
+            audio_path,
+            segment.start,
+            segment.end,
+            self._audio_export_options
+        )
+    
+    def _audio_options(self, options: ProcessingOptions) -> ProcessingOptions:
+        """MP3 export options derived from the main options"""
+        # For audio-only export, create optimized MP3 options
+        return ProcessingOptions(
+            output_format="mp3",
+            codec_copy=False,
+            video_codec=None,
+            audio_codec="libmp3lame",
+            audio_channels=options.audio_channels,
+            audio_sample_rate=options.audio_sample_rate,
+            normalize_audio=options.normalize_audio,
+            mp3_quality=options.mp3_quality,
+            extra_args=["-q:a", str(options.mp3_quality)]  # Variable bitrate quality
+        )
+    
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize filename by removing invalid characters"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '_')
-        return name.strip()
+        return name.translate(_SANITIZE_TABLE).strip()
     
     def cancel_processing(self) -> None:
         """Request cancellation of current processing"""
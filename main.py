@@ -4,21 +4,20 @@ AI-powered video editing and enhancement suite.
 """
 import sys
 import logging
+import multiprocessing
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from PyQt5.QtWidgets import QApplication, QMessageBox
+from typing import Optional
+from PyQt5.QtWidgets import QApplication, QMessageBox, QSplashScreen
+from PyQt5.QtGui import QColor, QPixmap
 from PyQt5.QtCore import Qt
 
 from config import config
-from services import (
-    ServiceRegistry,
-    BackgroundJobManager,
-    ExportQueueService,
-    AIService,
-    AudioEnhancementService,
-    MediaCacheService
-)
-from ui.main_app import VideoEditorApp
+
+# services and ui.main_app pull in the AI/audio stacks; they are imported
+# inside the functions below, once the splash screen is up
 
 logger = logging.getLogger(__name__)
 
@@ -36,8 +35,32 @@ def setup_logging():
         ]
     )
 
+def show_splash(app: QApplication) -> QSplashScreen:
+    """Show a plain splash screen while the heavy modules import."""
+    pixmap = QPixmap(420, 180)
+    pixmap.fill(QColor("#0f0f0f"))  # Dark theme background
+    
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "Video Editor Pro\n\nLoading...",
+        Qt.AlignCenter,
+        QColor("#009682")  # Dark theme accent
+    )
+    splash.show()
+    app.processEvents()
+    return splash
+
 def initialize_services():
-    """Initialize and start all application services."""
+    """Register all application services and start the critical ones."""
+    from services import (
+        ServiceRegistry,
+        BackgroundJobManager,
+        ExportQueueService,
+        AIService,
+        AudioEnhancementService,
+        MediaCacheService
+    )
+    
     registry = ServiceRegistry()
     
     # Register services in dependency order
@@ -48,9 +71,9 @@ def initialize_services():
     registry.register(AudioEnhancementService)
     
     try:
-        # Start all services
-        registry.start_all()
-        logger.info("All services started successfully")
+        # Needed before the window opens; the rest start after it shows
+        registry.start_services((BackgroundJobManager, ExportQueueService))
+        logger.info("Critical services started successfully")
     except Exception as e:
         logger.error(f"Failed to start services: {e}")
         QMessageBox.critical(
@@ -59,62 +82,44 @@ def initialize_services():
             f"Failed to start required services:\n{str(e)}\n\nThe application may not function correctly."
         )
 
-def cleanup_services():
-    """Clean up and stop all services."""
-    try:
-        ServiceRegistry().stop_all()
-        logger.info("All services stopped successfully")
-    except Exception as e:
-        logger.error(f"Error during service cleanup: {e}")
-
-def exception_handler(exctype, value, tb):
-    """Global exception handler to log unhandled exceptions."""
-    logger.critical("Unhandled exception:", exc_info=(exctype, value, tb))
-    traceback.print_exception(exctype, value, tb)
+def start_deferred_services() -> ThreadPoolExecutor:
+    """
+    Start the heavy services in the background
     
-    # Show error dialog to user
-    error_msg = f"An unexpected error occurred:\n\n{str(value)}\n\nCheck the log file for details."
-    QMessageBox.critical(None, "Error", error_msg)
-
-def main():
-    """Application entry point."""
-    # Set up logging first
-    setup_logging()
-    logger.info("Starting Video Editor Pro")
+    Each service's ready event is set once it has started; features
+    that need one check it instead of blocking the UI.
+    """
+    from services import (
+        ServiceRegistry,
+        AIService,
+        AudioEnhancementService,
+        MediaCacheService
+    )
     
-    # Install global exception handler
-    sys.excepthook = exception_handler
+    # Heavy to start: model loads and the cache sweep
+    deferred = (MediaCacheService, AIService, AudioEnhancementService)
     
-    # Create Qt application
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')  # Use Fusion style for better dark theme support
+    registry = ServiceRegistry()
+    executor = ThreadPoolExecutor(
+        max_workers=len(deferred),
+        thread_name_prefix="service-start"
+    )
+    for service_class in deferred:
+        executor.submit(registry.start_service, service_class)
+    return executor
+
+def cleanup_services(startup_executor: Optional[ThreadPoolExecutor] = None):
+    """Clean up and stop all services."""
+    from services import ServiceRegistry
     
     try:
-        # Initialize services
-        initialize_services()
-        
-        # Create and show main window
-        window = VideoEditorApp()
-        window.show()
-        
-        # Set up cleanup on app exit
-        app.aboutToQuit.connect(cleanup_services)
-        
-        # Start event loop
-        return app.exec_()
-        
+        # Let services that are still starting finish before stopping them
+        if startup_executor is not None:
+            startup_executor.shutdown(wait=True)
+        ServiceRegistry().stop_all()
+        logger.info("All services stopped successfully")
     except Exception as e:
-        logger.critical(f"Failed to start application: {e}")
-        QMessageBox.critical(
-            None,
-            "Startup Error",
-            f"Failed to start the application:\n\n{str(e)}"
-        )
-        return 1
-
-if __name__ == '__main__':
-    sys.exit(main())
-
+        logger.error(f"Error during service cleanup: {e}")
 
 def check_crash_recovery():
     """Check for crash recovery files"""
@@ -146,44 +151,72 @@ def check_crash_recovery():
                 # Clear recovery files if user declines
                 autosave.clear_recovery_files()
     except Exception as e:
-        logging.error(f"Crash recovery check failed: {str(e)}")
+        logger.error(f"Crash recovery check failed: {str(e)}")
 
+def exception_handler(exctype, value, tb):
+    """Global exception handler to log unhandled exceptions."""
+    logger.critical("Unhandled exception:", exc_info=(exctype, value, tb))
+    traceback.print_exception(exctype, value, tb)
+    
+    # Show error dialog to user
+    error_msg = f"An unexpected error occurred:\n\n{str(value)}\n\nCheck the log file for details."
+    QMessageBox.critical(None, "Error", error_msg)
 
 def main():
-    """Main entry point"""
+    """Application entry point."""
+    # Set up logging first
     setup_logging()
-    logger = logging.getLogger(__name__)
+    logger.info("Starting Video Editor Pro")
+    
+    # Install global exception handler
+    sys.excepthook = exception_handler
+    
+    # Set attributes BEFORE creating QApplication
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    
+    # Create Qt application
+    app = QApplication(sys.argv)
+    app.setApplicationName("Video Editor Pro")
+    app.setStyle('Fusion')  # Use Fusion style for better dark theme support
+    
+    # Feedback before the slow imports below
+    splash = show_splash(app)
     
     try:
-        # Set attributes BEFORE creating QApplication
-        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        # Initialize services
+        initialize_services()
         
-        # Create application
-        app = QApplication(sys.argv)
-        app.setApplicationName("Video Editor Pro")
+        from ui.main_app import VideoEditorApp
+        window = VideoEditorApp()
+        splash.finish(window)
         
         # Check for crash recovery
         check_crash_recovery()
         
-        # Create and show main window
-        window = VideoEditorApp()
+        # Show main window
         window.show()
         
-        logger.info("Application started successfully")
+        # Heavy services start while the window is already up
+        startup_executor = start_deferred_services()
+        
+        # Set up cleanup on app exit
+        app.aboutToQuit.connect(partial(cleanup_services, startup_executor))
         
-        # Run event loop
-        sys.exit(app.exec_())
+        # Start event loop
+        return app.exec_()
         
     except Exception as e:
-        logger.error(f"Application failed to start: {str(e)}", exc_info=True)
+        logger.critical(f"Failed to start application: {e}")
         QMessageBox.critical(
             None,
             "Startup Error",
-            f"Failed to start application:\n\n{str(e)}"
+            f"Failed to start the application:\n\n{str(e)}"
         )
-        sys.exit(1)
-
+        return 1
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    # Batch and audio work runs in process pools; in a frozen build each
+    # worker starts this exe, which must run the job instead of the GUI
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -1,7 +1,25 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
-@dataclass
+from utils.compat import DATACLASS_SLOTS
+
+
+@lru_cache(maxsize=128)
+def _ffmpeg_filters(
+    loudness: float,
+    eq_items: Tuple[Tuple[str, float], ...],
+    noise_reduction_amount: float
+) -> str:
+    """Filter string for a profile's values; batches reuse one profile"""
+    # Loudness normalization, then EQ, then noise reduction
+    parts = [f"loudnorm=I={loudness}"]
+    parts.extend(f"equalizer=f={freq}:t=q:w=1:g={gain}" for freq, gain in eq_items)
+    if noise_reduction_amount > 0:
+        parts.append(f"afftdn=nr={noise_reduction_amount}")
+    return ",".join(parts)
+
+@dataclass(**DATACLASS_SLOTS)
 class AudioProfile:
     """Represents audio characteristics and enhancement settings."""
     loudness: float  # in LUFS
@@ -14,20 +32,9 @@ class AudioProfile:
     
     def to_ffmpeg_filters(self) -> str:
         """Convert the audio profile to FFmpeg filter string."""
-        filters = []
-        
-        # Add loudness normalization
-        filters.append(f"loudnorm=I={self.loudness}")
-        
-        # Add EQ filters if any
-        if self.eq_settings:
-            eq_parts = []
-            for freq, gain in self.eq_settings.items():
-                eq_parts.append(f"equalizer=f={freq}:t=q:w=1:g={gain}")
-            filters.extend(eq_parts)
-            
-        # Add noise reduction if enabled
-        if self.noise_reduction_amount > 0:
-            filters.append(f"afftdn=nr={self.noise_reduction_amount}")
-            
-        return ",".join(filters)
\ No newline at end of file
+        # Keyed on the current values, so later edits to the profile still apply
+        return _ffmpeg_filters(
+            self.loudness,
+            tuple(self.eq_settings.items()) if self.eq_settings else (),
+            self.noise_reduction_amount
+        )
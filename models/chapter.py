@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Optional
 
-@dataclass
+from utils.compat import DATACLASS_SLOTS
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Chapter:
     """Represents a chapter marker with title and timing information."""
     title: str
@@ -10,7 +12,12 @@ class Chapter:
     end_time: timedelta
     description: Optional[str] = None
     auto_generated: bool = False
+    # Frozen, so the duration is worked out once; edits build a new Chapter
+    _duration: timedelta = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_duration', self.end_time - self.start_time)
     
     def duration(self) -> timedelta:
-        """Calculate the duration of this chapter."""
-        return self.end_time - self.start_time
\ No newline at end of file
+        """Duration of this chapter."""
+        return self._duration
\ No newline at end of file
@@ -3,6 +3,8 @@ from enum import Enum
 from typing import Optional, Any
 from datetime import datetime
 
+from utils.compat import DATACLASS_SLOTS
+
 class JobStatus(Enum):
     """Possible states for an export job."""
     QUEUED = "queued"
@@ -11,6 +13,9 @@ class JobStatus(Enum):
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+# Statuses a job never leaves
+_TERMINAL_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
 class JobType(Enum):
     """Types of background jobs supported by the application."""
     EXPORT = "export"
@@ -21,7 +26,7 @@ class JobType(Enum):
     CACHE_GENERATION = "cache_generation"
     AUTO_SUMMARIZE = "auto_summarize"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExportJob:
     """Represents a background processing job."""
     job_id: str
@@ -44,4 +49,4 @@ class ExportJob:
     @property
     def is_finished(self) -> bool:
         """Check if the job has finished (successfully or not)."""
-        return self.status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
\ No newline at end of file
+        return self.status in _TERMINAL_STATUSES
\ No newline at end of file
@@ -1,7 +1,22 @@
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Dict, Any, Optional
 from pathlib import Path
-import json
+
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        # orjson serializes dataclasses, nested ones included, natively
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=asdict).encode()
 
 @dataclass
 class VideoCodecSettings:
@@ -47,74 +62,11 @@ class ExportProfile:
     @classmethod
     def create_preset(cls, preset_name: str) -> 'ExportProfile':
         """Create a profile from a preset."""
-        presets = {
-            "youtube": cls(
-                name="YouTube HD",
-                description="Optimized for YouTube upload",
-                container="mp4",
-                video_codec=VideoCodecSettings(
-                    codec="h264",
-                    bitrate="5M",
-                    preset="medium",
-                    crf=18,
-                    max_rate="7M",
-                    buf_size="10M"
-                ),
-                audio_codec=AudioCodecSettings(
-                    codec="aac",
-                    bitrate="192k"
-                ),
-                normalize_audio=True
-            ),
-            "vimeo": cls(
-                name="Vimeo HD",
-                description="Optimized for Vimeo upload",
-                container="mp4",
-                video_codec=VideoCodecSettings(
-                    codec="h264",
-                    bitrate="8M",
-                    preset="slower",
-                    crf=20
-                ),
-                audio_codec=AudioCodecSettings(
-                    codec="aac",
-                    bitrate="320k"
-                )
-            ),
-            "device": cls(
-                name="Device Playback",
-                description="Optimized for mobile devices",
-                container="mp4",
-                video_codec=VideoCodecSettings(
-                    codec="h264",
-                    preset="fast",
-                    crf=23
-                ),
-                audio_codec=AudioCodecSettings(
-                    codec="aac",
-                    bitrate="128k"
-                )
-            ),
-            "archive": cls(
-                name="Archive Quality",
-                description="High quality archival",
-                container="mkv",
-                video_codec=VideoCodecSettings(
-                    codec="h265",
-                    preset="veryslow",
-                    crf=18
-                ),
-                audio_codec=AudioCodecSettings(
-                    codec="flac",
-                    bitrate="0"  # Lossless
-                )
-            )
-        }
-        
-        if preset_name not in presets:
+        if preset_name not in _PRESET_FACTORIES:
             raise ValueError(f"Unknown preset: {preset_name}")
         
-        return presets[preset_name]
+        # Built on demand; callers edit and save the profile they get
+        return _PRESET_FACTORIES[preset_name](cls)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary for serialization."""
@@ -136,73 +88,131 @@ class ExportProfile:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ExportProfile':
         """Create profile from dictionary."""
-        video_codec_data = data.pop("video_codec")
-        audio_codec_data = data.pop("audio_codec")
-        
-        profile = cls(**data)
-        profile.video_codec = VideoCodecSettings(**video_codec_data)
-        profile.audio_codec = AudioCodecSettings(**audio_codec_data)
-        
-        return profile
+        # Nested settings go straight to __init__, so the default
+        # instances are never built, and data itself is left untouched
+        return cls(**{
+            **data,
+            "video_codec": VideoCodecSettings(**data["video_codec"]),
+            "audio_codec": AudioCodecSettings(**data["audio_codec"])
+        })
     
     def save(self, path: str):
         """Save profile to file."""
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=4)
+        # Same fields, in the same order, as to_dict()
+        Path(path).write_bytes(_dumps(self))
     
     @classmethod
     def load(cls, path: str) -> 'ExportProfile':
         """Load profile from file."""
-        with open(path) as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        return cls.from_dict(_loads(Path(path).read_bytes()))
     
     def get_ffmpeg_args(self) -> list:
         """Get FFmpeg arguments for this profile."""
-        args = []
+        vc = self.video_codec
+        ac = self.audio_codec
         
-        # Container format
-        args.extend(["-f", self.container])
-        
-        # Video codec settings
-        args.extend(["-c:v", self.video_codec.codec])
-        if self.video_codec.bitrate:
-            args.extend(["-b:v", self.video_codec.bitrate])
-        if self.video_codec.preset:
-            args.extend(["-preset", self.video_codec.preset])
-        args.extend(["-crf", str(self.video_codec.crf)])
-        args.extend(["-pix_fmt", self.video_codec.pixel_format])
+        # Container format and video codec
+        args = ["-f", self.container, "-c:v", vc.codec]
+        if vc.bitrate:
+            args += ("-b:v", vc.bitrate)
+        if vc.preset:
+            args += ("-preset", vc.preset)
+        args += ("-crf", str(vc.crf), "-pix_fmt", vc.pixel_format)
         
         # Video dimensions
         if self.width and self.height:
             if self.maintain_aspect_ratio:
-                args.extend(["-vf", f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease"])
+                args += ("-vf", f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease")
             else:
-                args.extend(["-vf", f"scale={self.width}:{self.height}"])
+                args += ("-vf", f"scale={self.width}:{self.height}")
         
         # FPS
         if self.fps:
-            args.extend(["-r", str(self.fps)])
+            args += ("-r", str(self.fps))
         
         # Audio codec settings
-        args.extend(["-c:a", self.audio_codec.codec])
-        if self.audio_codec.bitrate:
-            args.extend(["-b:a", self.audio_codec.bitrate])
-        args.extend(["-ar", str(self.audio_codec.sample_rate)])
-        args.extend(["-ac", str(self.audio_codec.channels)])
+        args += ("-c:a", ac.codec)
+        if ac.bitrate:
+            args += ("-b:a", ac.bitrate)
+        args += ("-ar", str(ac.sample_rate), "-ac", str(ac.channels))
         
         # Additional settings
-        if self.video_codec.max_rate:
-            args.extend(["-maxrate", self.video_codec.max_rate])
-        if self.video_codec.buf_size:
-            args.extend(["-bufsize", self.video_codec.buf_size])
+        if vc.max_rate:
+            args += ("-maxrate", vc.max_rate)
+        if vc.buf_size:
+            args += ("-bufsize", vc.buf_size)
             
         # Metadata
         for key, value in self.metadata.items():
-            args.extend(["-metadata", f"{key}={value}"])
+            args += ("-metadata", f"{key}={value}")
         
         # Extra arguments
         if self.extra_ffmpeg_args:
-            args.extend(self.extra_ffmpeg_args.split())
+            args += self.extra_ffmpeg_args.split()
         
-        return args
\ No newline at end of file
+        return args
+
+# Preset name -> factory taking the profile class; only the requested one is built
+_PRESET_FACTORIES = {
+    "youtube": lambda cls: cls(
+        name="YouTube HD",
+        description="Optimized for YouTube upload",
+        container="mp4",
+        video_codec=VideoCodecSettings(
+            codec="h264",
+            bitrate="5M",
+            preset="medium",
+            crf=18,
+            max_rate="7M",
+            buf_size="10M"
+        ),
+        audio_codec=AudioCodecSettings(
+            codec="aac",
+            bitrate="192k"
+        ),
+        normalize_audio=True
+    ),
+    "vimeo": lambda cls: cls(
+        name="Vimeo HD",
+        description="Optimized for Vimeo upload",
+        container="mp4",
+        video_codec=VideoCodecSettings(
+            codec="h264",
+            bitrate="8M",
+            preset="slower",
+            crf=20
+        ),
+        audio_codec=AudioCodecSettings(
+            codec="aac",
+            bitrate="320k"
+        )
+    ),
+    "device": lambda cls: cls(
+        name="Device Playback",
+        description="Optimized for mobile devices",
+        container="mp4",
+        video_codec=VideoCodecSettings(
+            codec="h264",
+            preset="fast",
+            crf=23
+        ),
+        audio_codec=AudioCodecSettings(
+            codec="aac",
+            bitrate="128k"
+        )
+    ),
+    "archive": lambda cls: cls(
+        name="Archive Quality",
+        description="High quality archival",
+        container="mkv",
+        video_codec=VideoCodecSettings(
+            codec="h265",
+            preset="veryslow",
+            crf=18
+        ),
+        audio_codec=AudioCodecSettings(
+            codec="flac",
+            bitrate="0"  # Lossless
+        )
+    )
+}
\ No newline at end of file
@@ -1,8 +1,94 @@
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-from datetime import datetime
-import json
+from itertools import islice
+from typing import Any, Deque, List, Dict, Optional
+from datetime import datetime, timezone
 from pathlib import Path
+import os
+import time
+
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+except ImportError:
+    import json
+    
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+    
+    def _dumps_line(obj: Any) -> bytes:
+        return json.dumps(obj).encode() + b"\n"
+
+# Once a history log grows past this, the next save rewrites it with
+# only the entries still kept
+_HISTORY_COMPACT_BYTES = 1024 * 1024
+
+# Bytes read per step when reading a history log from the end
+_TAIL_BLOCK = 64 * 1024
+
+def _atomic_write(path: str, data: bytes):
+    """Write via a temp file next to path and os.replace it in"""
+    tmp_path = f"{path}.tmp"
+    Path(tmp_path).write_bytes(data)
+    os.replace(tmp_path, path)
+
+def _history_path(path: str) -> Path:
+    """History log kept next to a settings file"""
+    return Path(path).with_suffix('.history.jsonl')
+
+def _history_record(entry: Dict) -> Dict:
+    """History entry as written to the log, with the time as ISO text"""
+    ns = entry.get("timestamp_ns")
+    if ns is None:
+        return entry
+    stamp = datetime.fromtimestamp(ns // 10**9, tz=timezone.utc).replace(
+        microsecond=ns // 1000 % 10**6
+    )
+    record = {"timestamp": stamp.isoformat()}
+    record.update((key, value) for key, value in entry.items() if key != "timestamp_ns")
+    return record
+
+def _history_entry(record: Dict) -> Dict:
+    """History entry read from the log; entries already in ns pass through"""
+    stamp = record.get("timestamp")
+    if not isinstance(stamp, str):
+        return record
+    stamp = datetime.fromisoformat(stamp)
+    entry = {
+        "timestamp_ns": int(stamp.replace(microsecond=0).timestamp()) * 10**9
+        + stamp.microsecond * 1000
+    }
+    entry.update((key, value) for key, value in record.items() if key != "timestamp")
+    return entry
+
+def _read_last_lines(path: Path, count: int) -> List[bytes]:
+    """Last count non-empty lines of a file, read back from its end"""
+    if count <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # One newline more than needed, so a partial first line is dropped
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    
+    lines = data.splitlines()
+    if pos > 0:
+        lines = lines[1:]
+    return [line for line in lines if line][-count:]
 
 @dataclass
 class ProjectSettings:
@@ -37,10 +123,18 @@ class ProjectSettings:
     # Effect presets
     effect_presets: Dict = field(default_factory=dict)
     
-    # Recent changes for undo/redo
-    history: List[Dict] = field(default_factory=list)
+    # Recent changes for undo/redo; saved to a separate append-only log
+    history: Deque[Dict] = field(default_factory=deque)
     history_max_size: int = 50
     
+    # Log the history was last written to, and entries added since
+    _history_file: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+    _unsaved_history: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Oldest entries drop off in O(1) once the history is full
+        self.history = deque(self.history, maxlen=self.history_max_size)
+    
     def to_dict(self) -> dict:
         """Convert settings to dictionary for serialization."""
         return {
@@ -76,27 +170,57 @@ class ProjectSettings:
     def save(self, path: str):
         """Save settings to file."""
         self.modified_at = datetime.now()
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=4)
+        # A crash mid-save leaves the previous file intact
+        _atomic_write(path, _dumps(self.to_dict()))
+        self._save_history(path)
     
     @classmethod
     def load(cls, path: str) -> 'ProjectSettings':
         """Load settings from file."""
-        with open(path, 'r') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
+        settings = cls.from_dict(_loads(Path(path).read_bytes()))
+        
+        log_path = _history_path(path)
+        if log_path.exists():
+            settings.history.extend(
+                _history_entry(_loads(line))
+                for line in _read_last_lines(log_path, settings.history_max_size)
+            )
+            settings._history_file = log_path
+        
+        return settings
+    
+    def _save_history(self, path: str):
+        """Append the entries added since the last save to path's history log"""
+        log_path = _history_path(path)
+        
+        if log_path == self._history_file and (
+            not log_path.exists() or log_path.stat().st_size <= _HISTORY_COMPACT_BYTES
+        ):
+            mode = 'ab'
+            entries = islice(self.history, max(0, len(self.history) - self._unsaved_history), None)
+        elif self.history or log_path.exists():
+            # A new file, or one that has grown too big
+            mode = 'wb'
+            entries = iter(self.history)
+        else:
+            return
+        
+        with open(log_path, mode) as f:
+            f.writelines(_dumps_line(_history_record(entry)) for entry in entries)
+        self._history_file = log_path
+        self._unsaved_history = 0
     
     def add_to_history(self, action: str, data: dict):
         """Add an action to the history for undo/redo."""
+        # Epoch nanoseconds; bulk edits add entries faster than ISO
+        # formatting, which waits for the save. Whole microseconds, as
+        # that's all the saved ISO time keeps
         self.history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns() // 1000 * 1000,
             "action": action,
             "data": data
         })
-        
-        # Keep history size in check
-        if len(self.history) > self.history_max_size:
-            self.history.pop(0)
+        self._unsaved_history += 1
 
 @dataclass
 class Project:
@@ -104,13 +228,13 @@ class Project:
     settings: ProjectSettings
     backup_path: Optional[str] = None
     auto_backup_interval: int = 300  # seconds
-    _last_backup: datetime = field(default_factory=datetime.now)
+    _last_backup: float = field(default_factory=time.monotonic)
     
     def save(self, path: str = None):
         """Save the project to file."""
         if path is None and self.settings.video_path:
             # Use video path as base for project file
-            path = str(Path(self.settings.video_path).with_suffix('.vproj'))
+            path = os.path.splitext(self.settings.video_path)[0] + '.vproj'
         
         if path:
             self.settings.save(path)
@@ -124,10 +248,10 @@ class Project:
         if not self.backup_path:
             return
             
-        now = datetime.now()
-        if (now - self._last_backup).total_seconds() >= self.auto_backup_interval:
-            backup_file = Path(self.backup_path) / f"{self.settings.name}_{now.strftime('%Y%m%d_%H%M%S')}.vproj"
-            self.save(str(backup_file))
+        now = time.monotonic()
+        if now - self._last_backup >= self.auto_backup_interval:
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            self.save(os.path.join(self.backup_path, f"{self.settings.name}_{stamp}.vproj"))
             self._last_backup = now
     
     def restore_from_backup(self, backup_path: str) -> None:
@@ -137,11 +261,12 @@ class Project:
     @staticmethod
     def list_backups(backup_dir: str) -> List[str]:
         """List available backup files in the backup directory."""
-        backup_path = Path(backup_dir)
-        if not backup_path.exists():
+        if not os.path.isdir(backup_dir):
             return []
-            
-        return [str(f) for f in backup_path.glob("*.vproj")]
+        
+        # scandir yields names without building a Path per entry
+        with os.scandir(backup_dir) as entries:
+            return [entry.path for entry in entries if entry.name.endswith('.vproj')]
     
     @classmethod
     def create_from_template(cls, template_name: str, video_path: str) -> 'Project':
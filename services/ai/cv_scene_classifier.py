@@ -1,5 +1,8 @@
-from typing import List, Dict
+from typing import Iterator, List, Dict, Tuple
 import logging
+import shutil
+import subprocess
+import tempfile
 import cv2
 import numpy as np
 from pathlib import Path
@@ -11,15 +14,46 @@ from .scene_classifier import SceneClassifier
 
 logger = logging.getLogger(__name__)
 
+# Keywords for each scene label
+_KEYWORDS = {
+    "interview": ("person", "talking", "conversation"),
+    "action": ("movement", "dynamic", "fast-paced"),
+    "b-roll": ("background", "establishing", "context"),
+    "dialogue": ("conversation", "interaction", "people"),
+    "transition": ("change", "effect", "bridge"),
+    "montage": ("sequence", "collection", "highlights"),
+    "establishing_shot": ("location", "setting", "context")
+}
+
+# Base importance of each scene label, scaled by classification confidence
+_IMPORTANCE_WEIGHTS = {
+    "interview": 0.8,
+    "action": 0.7,
+    "dialogue": 0.75,
+    "b-roll": 0.4,
+    "transition": 0.2,
+    "montage": 0.6,
+    "establishing_shot": 0.5
+}
+
 class CVSceneClassifier(SceneClassifier):
     """Computer vision-based scene classifier implementation."""
     
+    # Frames are compared at this size, a batch at a time
+    ANALYSIS_SIZE = (160, 90)
+    BATCH_SIZE = 64
+    
+    # BT.601 luma weights in OpenCV's BGR channel order
+    _GRAY_WEIGHTS = np.array([0.114, 0.587, 0.299], dtype=np.float32)
+    
     def __init__(self):
         """Initialize the scene classifier."""
         self.scene_categories = [
             "interview", "action", "b-roll", "dialogue", 
             "transition", "montage", "establishing_shot"
         ]
+        # Frames come from FFmpeg when it is installed, else from OpenCV
+        self.ffmpeg_path = shutil.which('ffmpeg')
     
     def classify_scenes(self, video_path: str) -> List[Scene]:
         """Detect and classify scenes in a video."""
@@ -29,85 +63,153 @@ class CVSceneClassifier(SceneClassifier):
         if not video.isOpened():
             raise RuntimeError(f"Could not open video file: {video_path}")
         
+        batches = self._frame_batches(video, video_path)
         try:
             fps = video.get(cv2.CAP_PROP_FPS)
-            total_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
             
             # Scene detection parameters
             min_scene_duration = int(fps * 2)  # 2 seconds minimum
             threshold = 30.0  # Difference threshold for scene changes
             
-            prev_frame = None
+            prev_gray = None
             scene_start_frame = 0
             frame_count = 0
             
-            while True:
-                ret, frame = video.read()
-                if not ret:
-                    break
-                
-                frame_count += 1
+            for batch, count in batches:
+                # Grayscale and mean frame difference for the whole batch
+                gray = batch[:count] @ self._GRAY_WEIGHTS
+                if prev_gray is not None:
+                    gray = np.concatenate((prev_gray[np.newaxis], gray))
+                diffs = np.abs(np.diff(gray, axis=0)).mean(axis=(1, 2))
                 
-                if prev_frame is None:
-                    prev_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    continue
+                # Frame number of the frame before diffs[0]'s frame
+                offset = frame_count + count - len(diffs)
                 
-                # Convert current frame to grayscale
-                curr_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                # Detect scene changes; only frames over the threshold reach Python
+                for i in np.flatnonzero(diffs > threshold):
+                    current_frame = offset + int(i) + 1
+                    if current_frame - scene_start_frame > min_scene_duration:
+                        scenes.append(self._create_scene(
+                            video_path, scene_start_frame, current_frame, fps
+                        ))
+                        
+                        # Start new scene
+                        scene_start_frame = current_frame
                 
-                # Calculate frame difference
-                diff = cv2.absdiff(curr_frame, prev_frame)
-                mean_diff = np.mean(diff)
-                
-                # Detect scene change
-                if (mean_diff > threshold and 
-                    frame_count - scene_start_frame > min_scene_duration):
-                    
-                    # Analyze the scene content
-                    scene_label, confidence = self._analyze_scene_content(
-                        video_path, scene_start_frame, frame_count, fps
-                    )
-                    
-                    # Create scene object
-                    scene = Scene(
-                        start_time=timedelta(seconds=scene_start_frame/fps),
-                        end_time=timedelta(seconds=frame_count/fps),
-                        label=scene_label,
-                        confidence_score=confidence,
-                        keywords=self._extract_keywords(scene_label),
-                        importance_score=self._calculate_importance(
-                            scene_label, confidence
-                        )
-                    )
-                    scenes.append(scene)
-                    
-                    # Start new scene
-                    scene_start_frame = frame_count
-                
-                prev_frame = curr_frame
+                frame_count += count
+                prev_gray = gray[-1]
             
             # Add final scene if needed
             if frame_count - scene_start_frame > min_scene_duration:
-                scene_label, confidence = self._analyze_scene_content(
+                scenes.append(self._create_scene(
                     video_path, scene_start_frame, frame_count, fps
-                )
-                scene = Scene(
-                    start_time=timedelta(seconds=scene_start_frame/fps),
-                    end_time=timedelta(seconds=frame_count/fps),
-                    label=scene_label,
-                    confidence_score=confidence,
-                    keywords=self._extract_keywords(scene_label),
-                    importance_score=self._calculate_importance(
-                        scene_label, confidence
-                    )
-                )
-                scenes.append(scene)
+                ))
         
         finally:
+            batches.close()
             video.release()
         
         return scenes
     
+    def _frame_batches(
+        self,
+        video: cv2.VideoCapture,
+        video_path: str
+    ) -> Iterator[Tuple[np.ndarray, int]]:
+        """
+        Yield (batch, count) for each run of frames, downscaled to ANALYSIS_SIZE
+        
+        FFmpeg decodes and scales when available, on a hardware decoder
+        if it finds one; otherwise OpenCV decodes full-size frames. The
+        same buffer is reused, so only batch[:count] is valid each time.
+        """
+        width, height = self.ANALYSIS_SIZE
+        batch = np.empty((self.BATCH_SIZE, height, width, 3), dtype=np.uint8)
+        
+        if not self.ffmpeg_path:
+            while True:
+                count = self._read_batch(video, batch)
+                if count == 0:
+                    return
+                yield batch, count
+        
+        cmd = [
+            self.ffmpeg_path, '-hide_banner', '-nostats', '-loglevel', 'error',
+            '-hwaccel', 'auto',
+            '-i', video_path,
+            '-an',
+            '-vf', f'scale={width}:{height}:flags=area',
+            '-vsync', '0',
+            '-f', 'rawvideo',
+            '-pix_fmt', 'bgr24',
+            'pipe:1'
+        ]
+        
+        # stderr is spooled to a file so a full pipe can't stall the decode
+        with tempfile.TemporaryFile() as log:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=log,
+                bufsize=1 << 20
+            )
+            try:
+                while True:
+                    count = self._read_pipe_batch(proc.stdout, batch)
+                    if count == 0:
+                        break
+                    yield batch, count
+            finally:
+                proc.stdout.close()
+                if proc.poll() is None:
+                    proc.kill()
+                returncode = proc.wait()
+            
+            if returncode != 0:
+                log.seek(0)
+                error = log.read().decode(errors='replace').strip()
+                raise RuntimeError(f"FFmpeg could not decode {video_path}: {error}")
+    
+    def _read_batch(self, video: cv2.VideoCapture, batch: np.ndarray) -> int:
+        """
+        Read the next frames into batch, downscaled to ANALYSIS_SIZE
+        
+        Returns:
+            Number of frames read; less than len(batch) at the end
+        """
+        for count in range(len(batch)):
+            ret, frame = video.read()
+            if not ret:
+                return count
+            batch[count] = cv2.resize(frame, self.ANALYSIS_SIZE, interpolation=cv2.INTER_AREA)
+        return len(batch)
+    
+    def _read_pipe_batch(self, pipe, batch: np.ndarray) -> int:
+        """Read the next raw BGR frames from an FFmpeg pipe into batch"""
+        frame_bytes = batch[0].nbytes
+        for count in range(len(batch)):
+            if pipe.readinto(memoryview(batch[count]).cast('B')) < frame_bytes:
+                return count
+        return len(batch)
+    
+    def _create_scene(self, video_path: str, start_frame: int,
+                      end_frame: int, fps: float) -> Scene:
+        """Analyze a frame range and build its Scene."""
+        scene_label, confidence = self._analyze_scene_content(
+            video_path, start_frame, end_frame, fps
+        )
+        return Scene(
+            start_time=timedelta(seconds=start_frame/fps),
+            end_time=timedelta(seconds=end_frame/fps),
+            label=scene_label,
+            confidence_score=confidence,
+            keywords=self._extract_keywords(scene_label),
+            importance_score=self._calculate_importance(
+                scene_label, confidence
+            )
+        )
+    
     def get_supported_labels(self) -> List[str]:
         """Get the list of scene labels this classifier can detect."""
         return self.scene_categories
@@ -122,29 +224,10 @@ class CVSceneClassifier(SceneClassifier):
     
     def _extract_keywords(self, scene_label: str) -> List[str]:
         """Extract relevant keywords for a scene type."""
-        keywords_map = {
-            "interview": ["person", "talking", "conversation"],
-            "action": ["movement", "dynamic", "fast-paced"],
-            "b-roll": ["background", "establishing", "context"],
-            "dialogue": ["conversation", "interaction", "people"],
-            "transition": ["change", "effect", "bridge"],
-            "montage": ["sequence", "collection", "highlights"],
-            "establishing_shot": ["location", "setting", "context"]
-        }
-        return keywords_map.get(scene_label, [])
+        # A fresh list per scene, as Scene.keywords is a mutable List[str]
+        return list(_KEYWORDS.get(scene_label, ()))
     
     def _calculate_importance(self, scene_label: str, 
                             confidence: float) -> float:
         """Calculate an importance score for the scene."""
-        importance_weights = {
-            "interview": 0.8,
-            "action": 0.7,
-            "dialogue": 0.75,
-            "b-roll": 0.4,
-            "transition": 0.2,
-            "montage": 0.6,
-            "establishing_shot": 0.5
-        }
-        
-        base_importance = importance_weights.get(scene_label, 0.5)
-        return base_importance * confidence
\ No newline at end of file
+        return _IMPORTANCE_WEIGHTS.get(scene_label, 0.5) * confidence
\ No newline at end of file
@@ -16,6 +16,10 @@ class Service(ABC):
     def __init__(self):
         self._is_running = False
         self._executor = None
+        # Set by the registry once start() has finished
+        self.ready = threading.Event()
+        # Set by the registry instead if start() raised
+        self.start_error: Optional[Exception] = None
         
     @abstractmethod
     def start(self) -> None:
@@ -27,6 +31,7 @@ class Service(ABC):
     def stop(self) -> None:
         """Stop and cleanup the service."""
         self._is_running = False
+        self.ready.clear()
         if self._executor:
             self._executor.shutdown(wait=True)
             
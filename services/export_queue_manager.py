@@ -6,6 +6,7 @@ import threading
 from typing import Dict, List, Optional, Callable
 from datetime import datetime
 import uuid
+from dataclasses import fields
 import json
 import os
 from pathlib import Path
@@ -67,7 +68,7 @@ class ExportQueueManager:
                 'source_file': source_file,
                 'segments': segments,
                 'output_dir': output_dir,
-                'options': options.__dict__
+                'options': {f.name: getattr(options, f.name) for f in fields(options)}
             }
         )
         
@@ -221,7 +222,9 @@ class ExportQueueManager:
                 )
                 
                 # Update job result
-                job.result['processed'] = [p.__dict__ for p in processed]
+                job.result['processed'] = [
+                    {f.name: getattr(p, f.name) for f in fields(p)} for p in processed
+                ]
                 job.status = JobStatus.COMPLETED
                 
             except Exception as e:
@@ -186,11 +186,15 @@ class MLService(Service):
         force_reload: bool = False
     ) -> Optional[Any]:
         """Load scene classification model"""
-        return self.model_cache.get_model(
+        model = self.model_cache.get_model(
             model_id or self.SCENE_MODEL,
             "scene",
             force_reload
         )
+        if model is not None:
+            # Conv nets run faster on NHWC inputs, especially under autocast
+            model = model.to(memory_format=torch.channels_last).eval()
+        return model
     
     def load_speech_model(
         self,
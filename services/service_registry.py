@@ -1,4 +1,4 @@
-from typing import Dict, Type
+from typing import Dict, Iterable, Type
 import logging
 from .base_service import Service
 
@@ -29,14 +29,28 @@ class ServiceRegistry:
             raise KeyError(f"Service {service_name} not registered")
         return self._services[service_name]
     
+    def start_service(self, service_class: Type[Service]) -> None:
+        """Start one registered service and mark it ready or failed."""
+        service_name = service_class.__name__
+        service = self.get_service(service_class)
+        service.start_error = None
+        try:
+            logger.info(f"Starting service: {service_name}")
+            service.start()
+            service.ready.set()
+        except Exception as e:
+            logger.error(f"Failed to start service {service_name}: {e}")
+            service.start_error = e
+    
+    def start_services(self, service_classes: Iterable[Type[Service]]) -> None:
+        """Start the given registered services in order."""
+        for service_class in service_classes:
+            self.start_service(service_class)
+    
     def start_all(self) -> None:
         """Start all registered services."""
-        for service_name, service in self._services.items():
-            try:
-                logger.info(f"Starting service: {service_name}")
-                service.start()
-            except Exception as e:
-                logger.error(f"Failed to start service {service_name}: {e}")
+        for service in self._services.values():
+            self.start_service(type(service))
     
     def stop_all(self) -> None:
         """Stop all registered services."""
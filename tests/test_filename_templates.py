@@ -0,0 +1,40 @@
+import re
+
+from core.filename_templates import FilenameTemplate
+
+def test_default_template():
+    """Times are written as whole seconds."""
+    template = FilenameTemplate()
+    
+    assert template.format(label="Intro", start=1.9, end=10) == "Intro_1_10"
+
+def test_adjacent_variables_and_literals():
+    """Variables next to each other and to literal text all resolve."""
+    template = FilenameTemplate("{project}-{index}{label}.{start_time}")
+    
+    result = template.format(project_name="Trip", index=3, label="Beach", start=3725)
+    
+    assert result == "Trip-3Beach.01-02-05"
+
+def test_unknown_variables_kept_literally():
+    """Unknown or unclosed variables are left as written and fail validation."""
+    template = FilenameTemplate("{label}_{foo}_{end")
+    
+    assert template.format(label="Intro") == "Intro_{foo}_{end"
+    assert template.validate() == (False, "Unknown variables: foo")
+
+def test_variable_values_sanitized():
+    """Characters not allowed in filenames are replaced in variable values."""
+    template = FilenameTemplate("{label}_{video}")
+    
+    result = template.format(label="a/b:c ", video_path="/videos/clip.mp4")
+    
+    assert result == "a_b_c_clip"
+
+def test_date_variables():
+    """The clock is only read by templates that show it."""
+    assert not FilenameTemplate("{label}_{index}")._needs_now
+    
+    template = FilenameTemplate("{date}_{time}")
+    assert template._needs_now
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}", template.format())
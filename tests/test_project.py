@@ -1,7 +1,8 @@
 import pytest
 from pathlib import Path
+import json
 import tempfile
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from models.project import Project, ProjectSettings
 from models.scene import Scene
@@ -65,4 +66,89 @@ def test_project_backup(sample_project, temp_project_dir):
     
     # Compare
     assert restored_project.settings.name == sample_project.settings.name
-    assert restored_project.settings.video_path == sample_project.settings.video_path
\ No newline at end of file
+    assert restored_project.settings.video_path == sample_project.settings.video_path
+
+def _history_ids(settings):
+    """The "i" of each history entry, oldest first."""
+    return [entry["data"]["i"] for entry in settings.history]
+
+def test_history_saves_load_latest_entries(sample_project_settings, temp_project_dir):
+    """History appended over several saves loads back as the newest entries."""
+    path = str(temp_project_dir / "settings.json")
+    settings = sample_project_settings
+    max_size = settings.history_max_size
+    
+    for i in range(30):
+        settings.add_to_history("edit", {"i": i})
+    settings.save(path)
+    for i in range(30, 70):
+        settings.add_to_history("edit", {"i": i})
+    settings.save(path)
+    
+    loaded = ProjectSettings.load(path)
+    assert _history_ids(loaded) == list(range(70 - max_size, 70))
+    
+    # Saving a loaded project appends only what was added since
+    for i in range(70, 75):
+        loaded.add_to_history("edit", {"i": i})
+    loaded.save(path)
+    
+    reloaded = ProjectSettings.load(path)
+    assert _history_ids(reloaded) == list(range(75 - max_size, 75))
+
+def test_history_log_compacted(sample_project_settings, temp_project_dir, monkeypatch):
+    """A log past the size limit is rewritten with only the kept entries."""
+    monkeypatch.setattr("models.project._HISTORY_COMPACT_BYTES", 1024)
+    path = str(temp_project_dir / "settings.json")
+    log_path = temp_project_dir / "settings.history.jsonl"
+    settings = sample_project_settings
+    max_size = settings.history_max_size
+    
+    for i in range(max_size):
+        settings.add_to_history("edit", {"i": i})
+    settings.save(path)
+    assert log_path.stat().st_size > 1024
+    
+    for i in range(max_size, 2 * max_size):
+        settings.add_to_history("edit", {"i": i})
+    settings.save(path)
+    
+    assert len(log_path.read_bytes().splitlines()) == max_size
+    assert _history_ids(ProjectSettings.load(path)) == list(range(max_size, 2 * max_size))
+
+def test_history_tail_read_across_blocks(sample_project_settings, temp_project_dir, monkeypatch):
+    """Lines split across tail read blocks still load whole."""
+    # Much shorter than a line, so nearly every line spans several blocks
+    monkeypatch.setattr("models.project._TAIL_BLOCK", 7)
+    path = str(temp_project_dir / "settings.json")
+    settings = sample_project_settings
+    
+    for i in range(80):
+        settings.add_to_history("edit", {"i": i, "text": "x" * (i % 13)})
+        if i % 20 == 19:
+            settings.save(path)
+    
+    loaded = ProjectSettings.load(path)
+    assert list(loaded.history) == list(settings.history)
+
+def test_history_log_keeps_iso_timestamps(sample_project_settings, temp_project_dir):
+    """The log stores ISO "timestamp" fields, and older logs still load."""
+    path = str(temp_project_dir / "settings.json")
+    log_path = temp_project_dir / "settings.history.jsonl"
+    settings = sample_project_settings
+    settings.add_to_history("edit", {"i": 0})
+    settings.save(path)
+    
+    record = json.loads(log_path.read_bytes().splitlines()[0])
+    assert list(record) == ["timestamp", "action", "data"]
+    assert datetime.fromisoformat(record["timestamp"]).timestamp() * 10**9 == pytest.approx(
+        settings.history[0]["timestamp_ns"], abs=10**3
+    )
+    
+    # A log from before entries kept their time in nanoseconds
+    log_path.write_text(json.dumps(
+        {"timestamp": "2024-01-02T03:04:05.678901", "action": "old", "data": {}}
+    ) + "\n")
+    entry = ProjectSettings.load(path).history[0]
+    assert entry["action"] == "old"
+    assert entry["timestamp_ns"] == int(datetime(2024, 1, 2, 3, 4, 5).timestamp()) * 10**9 + 678901000
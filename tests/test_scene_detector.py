@@ -0,0 +1,98 @@
+import io
+import random
+import re
+
+import numpy as np
+import pytest
+
+import core.scene_detector as scene_detector
+from core.scene_detector import SceneDetector
+
+def _linear_scenes(timestamps, min_scene_length, duration):
+    """Reference grouping: visit every timestamp in order"""
+    scenes = []
+    start = 0.0
+    for timestamp in timestamps:
+        if timestamp - start >= min_scene_length:
+            scenes.append((start, timestamp))
+            start = timestamp
+    if duration - start >= min_scene_length:
+        scenes.append((start, duration))
+    return scenes
+
+@pytest.fixture
+def detector():
+    return SceneDetector()
+
+def test_timestamps_to_scenes_skips_short_scenes(detector):
+    """Changes too close to the previous cut are skipped."""
+    scenes = detector._timestamps_to_scenes([1, 1.5, 2, 4, 9.5], "video.mp4", 2.0, duration=10.0)
+    
+    # 9.5 leaves a final scene shorter than the minimum, so it's dropped
+    assert scenes == [(0.0, 2.0), (2.0, 4.0), (4.0, 9.5)]
+
+def test_timestamps_to_scenes_empty(detector):
+    """No scene changes means no scenes."""
+    assert detector._timestamps_to_scenes([], "video.mp4", 1.0, duration=10.0) == []
+
+@pytest.mark.parametrize("seed", range(20))
+def test_timestamps_to_scenes_matches_linear_scan(detector, seed):
+    """The binary search finds the same cuts as a linear scan."""
+    rng = random.Random(seed)
+    # Rounded to few digits, so exact ties with start + min are common
+    timestamps = sorted({
+        round(rng.uniform(0, 100), rng.choice([0, 1, 2, 6]))
+        for _ in range(rng.randint(1, 60))
+    })
+    min_scene_length = rng.choice([0, 0.1, 0.3, 0.7, 1, 2, 2.5, 7])
+    
+    scenes = detector._timestamps_to_scenes(timestamps, "video.mp4", min_scene_length, duration=100.0)
+    
+    assert scenes == _linear_scenes(timestamps, min_scene_length, 100.0)
+
+class FakeDecode:
+    """Stands in for the FFmpeg decode, returning a frame per selected time."""
+    
+    # Shortest single argument that fails to exec on Linux (MAX_ARG_STRLEN)
+    MAX_ARG = 128 * 1024
+    
+    def __init__(self, cmd, stdin=None, stdout=None, stderr=None):
+        assert all(len(arg) < self.MAX_ARG for arg in cmd)
+        script = cmd[cmd.index('-filter_script:v') + 1]
+        with open(script) as f:
+            times = [float(t) for t in re.findall(r'gte\(t\\,([-0-9.e]+)\)', f.read())]
+        
+        # The frame just after each selected time, tagged with its index
+        frame_bytes = scene_detector.FRAME_SIZE ** 2 * 3
+        data = b''.join(bytes([i % 256]) * frame_bytes for i in range(len(times)))
+        for t in times:
+            stderr.write(f"[Parsed_showinfo_1 @ 0x0] n:0 pts_time:{t + 0.002:.6f}\n".encode())
+        self.stdout = io.BytesIO(data)
+        self.returncode = 0
+    
+    def wait(self):
+        return self.returncode
+
+def test_decode_many_sample_times(detector, monkeypatch):
+    """Thousands of sample times don't make an over-long FFmpeg argument."""
+    monkeypatch.setattr(scene_detector.subprocess, "Popen", FakeDecode)
+    # Tiny frames; only the count matters here
+    monkeypatch.setattr(scene_detector, "FRAME_SIZE", 2)
+    sample_times = [[i * 0.5, i * 0.5 + 0.25] for i in range(2500)]
+    
+    scene_frames = detector._decode_frames_at("video.mp4", sample_times)
+    
+    assert [len(frames) for frames in scene_frames] == [2] * len(sample_times)
+    # Frames come back in time order, one per sample
+    assert scene_frames[1][0, 0, 0, 0] == 2 % 256
+    assert scene_frames[-1][1, 0, 0, 0] == 4999 % 256
+
+def test_frame_batches_bounded():
+    """Scenes' frames are joined in order into batches of at most size."""
+    scene_frames = [np.full((count, 2, 2, 3), i, dtype=np.uint8) for i, count in enumerate([3, 0, 5, 1])]
+    
+    batches = list(scene_detector._frame_batches(scene_frames, 4))
+    
+    assert [len(batch) for batch in batches] == [4, 4, 1]
+    assert np.concatenate(batches)[:, 0, 0, 0].tolist() == [0, 0, 0, 2, 2, 2, 2, 2, 3]
+
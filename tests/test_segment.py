@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from core.segment import Segment, find_overlaps
+
+def _brute_force_overlaps(segments):
+    return [
+        (i, j)
+        for i in range(len(segments))
+        for j in range(i + 1, len(segments))
+        if segments[i].overlaps_with(segments[j])
+    ]
+
+def test_find_overlaps_pairs():
+    """Overlapping pairs come back as sorted (i, j) index pairs."""
+    segments = [
+        Segment(10, 20),
+        Segment(0, 5),
+        Segment(15, 30),
+        # Touching but not overlapping
+        Segment(5, 10),
+        Segment(12, 13),
+    ]
+    
+    assert find_overlaps(segments) == [(0, 2), (0, 4)]
+
+def test_find_overlaps_trivial():
+    """Fewer than two segments can't overlap."""
+    assert find_overlaps([]) == []
+    assert find_overlaps([Segment(0, 1)]) == []
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_overlaps_matches_pairwise(seed):
+    """Matches checking overlaps_with on every pair."""
+    rng = random.Random(seed)
+    segments = []
+    for _ in range(60):
+        # Whole seconds so equal starts and touching ends are common
+        start = rng.randint(0, 100)
+        segments.append(Segment(start, start + rng.randint(1, 15)))
+    
+    assert find_overlaps(segments) == _brute_force_overlaps(segments)
@@ -0,0 +1,86 @@
+import pytest
+
+from core.segment import Segment
+from core.undo_manager import AddSegmentCommand, ModifySegmentCommand, UndoManager
+
+@pytest.fixture
+def segment():
+    return Segment(0, 10, label="Intro")
+
+def _move_end(manager, segment, value):
+    manager.execute(ModifySegmentCommand(segment, "end", segment.end, value))
+
+def test_repeated_edits_coalesce(segment):
+    """Quick edits of one attribute undo as a single step."""
+    manager = UndoManager(coalesce_window_ms=60_000)
+    
+    for value in (11, 12, 13):
+        _move_end(manager, segment, value)
+    
+    assert manager.get_history() == ["Modify 'Intro' end"]
+    assert manager.undo()
+    assert segment.end == 10
+    assert not manager.can_undo()
+    
+    assert manager.redo()
+    assert segment.end == 13
+
+def test_edits_outside_window_stay_separate(segment):
+    """Edits further apart than the window are undone one at a time."""
+    manager = UndoManager(coalesce_window_ms=0)
+    
+    _move_end(manager, segment, 11)
+    _move_end(manager, segment, 12)
+    
+    assert len(manager.get_history()) == 2
+    manager.undo()
+    assert segment.end == 11
+
+def test_different_attributes_or_undo_break_coalescing(segment):
+    """Only the same attribute merges, and never across an undo."""
+    manager = UndoManager(coalesce_window_ms=60_000)
+    
+    _move_end(manager, segment, 11)
+    manager.execute(ModifySegmentCommand(segment, "label", "Intro", "Opening"))
+    assert len(manager.get_history()) == 2
+    
+    manager.undo()
+    _move_end(manager, segment, 12)
+    
+    assert len(manager.get_history()) == 2
+    manager.undo()
+    assert segment.end == 11
+
+def test_transaction_undoes_as_one(segment):
+    """Commands in a transaction undo together, in reverse order."""
+    manager = UndoManager(coalesce_window_ms=60_000)
+    segments = []
+    
+    manager.begin_transaction("Split")
+    # Nested begins join the open transaction
+    manager.begin_transaction("Inner")
+    manager.execute(AddSegmentCommand(segments, segment))
+    _move_end(manager, segment, 5)
+    manager.execute(AddSegmentCommand(segments, Segment(5, 10, label="Rest")))
+    manager.end_transaction()
+    
+    assert manager.get_history() == ["Split"]
+    assert [s.label for s in segments] == ["Intro", "Rest"]
+    
+    # An edit right after the transaction doesn't merge into it
+    _move_end(manager, segment, 6)
+    assert manager.get_history() == ["Split", "Modify 'Intro' end"]
+    
+    manager.undo()
+    manager.undo()
+    assert segments == []
+    assert segment.end == 10
+
+def test_empty_transaction_adds_nothing():
+    """A transaction without commands leaves the history alone."""
+    manager = UndoManager()
+    
+    manager.begin_transaction()
+    manager.end_transaction()
+    
+    assert not manager.can_undo()
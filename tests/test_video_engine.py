@@ -0,0 +1,112 @@
+import pytest
+from pathlib import Path
+
+from core.segment import Segment
+from core.video_engine import VideoEngine, ProcessingOptions
+import core.video_engine as video_engine
+
+class FakeFFmpeg:
+    """Stands in for FFmpegWrapper, cutting only on a fixed keyframe grid."""
+    
+    def __init__(self, keyframe_interval: float = 2.0, duration: float = 20.0):
+        self.keyframes = [
+            i * keyframe_interval for i in range(int(duration / keyframe_interval))
+        ]
+        self.duration = duration
+        self.extracted = []
+        self.split_calls = 0
+    
+    def get_video_info(self, path: str) -> dict:
+        return {'duration': self.duration}
+    
+    def split_copy(self, input_path, output_pattern, cut_points, list_path, options=None):
+        self.split_calls += 1
+        # Like the segment muxer: at most one cut per keyframe, each at the
+        # first keyframe at or after the next pending cut point
+        boundaries = [0.0]
+        pending = list(cut_points)
+        for keyframe in self.keyframes[1:]:
+            if pending and keyframe >= pending[0]:
+                pending.pop(0)
+                boundaries.append(keyframe)
+        boundaries.append(self.duration)
+        
+        parts = []
+        for i, (start, end) in enumerate(zip(boundaries, boundaries[1:])):
+            path = output_pattern % i
+            Path(path).write_text(f"{start}-{end}")
+            parts.append((path, start, end))
+        return parts
+    
+    def extract_clip(self, input_path, output_path, start, end, options):
+        self.extracted.append((start, end))
+        Path(output_path).write_text(f"clip {start}-{end}")
+
+@pytest.fixture
+def engine(monkeypatch, tmp_path):
+    """VideoEngine on a fake 20 s video with a keyframe every 2 s."""
+    monkeypatch.setattr(video_engine, "FFmpegWrapper", FakeFFmpeg)
+    engine = VideoEngine()
+    video = tmp_path / "video.mp4"
+    video.touch()
+    engine.load_video(str(video))
+    return engine
+
+def test_copy_fast_boundaries_within_one_gop(engine, tmp_path):
+    """Cut points sharing a GOP never hand one segment another's part."""
+    segments = [
+        Segment(0, 5, label="a", export_audio=False),
+        # Both ends fall between the keyframes at 4 s and 8 s
+        Segment(5.5, 6.5, label="b", export_audio=False),
+        Segment(10, 14, label="c", export_audio=False),
+        Segment(16, 20, label="d", export_audio=False),
+    ]
+    out_dir = tmp_path / "out"
+    options = ProcessingOptions(codec_copy=True, output_format="mp4", export_both_formats=False)
+    
+    results = engine.process_segments_copy_fast(segments, str(out_dir), options)
+    
+    assert all(r.success for r in results)
+    outputs = {
+        segment.label: (out_dir / f"{engine._base_name(segment)}.mp4").read_text()
+        for segment in segments
+    }
+    # a's part starts with it and ends at the next keyframe
+    assert outputs["a"] == "0.0-6.0"
+    # b's part would start at 6 s, losing its first half second
+    assert outputs["b"] == "clip 5.5-6.5"
+    # The merged cuts end c's part at 12 s
+    assert outputs["c"] == "clip 10-14"
+    assert outputs["d"] == "16.0-20.0"
+    assert engine.ffmpeg.extracted == [(5.5, 6.5), (10, 14)]
+
+def test_copy_fast_split_failure_falls_back(engine, tmp_path, monkeypatch):
+    """If the single split fails, every segment is still exported."""
+    def fail(*args, **kwargs):
+        raise RuntimeError("split failed")
+    monkeypatch.setattr(engine.ffmpeg, "split_copy", fail)
+    
+    segments = [
+        Segment(0, 8, label="a", export_audio=False),
+        Segment(8, 16, label="b", export_audio=False),
+    ]
+    options = ProcessingOptions(codec_copy=True, output_format="mp4", export_both_formats=False)
+    
+    results = engine.process_segments_copy_fast(segments, str(tmp_path / "out"), options)
+    
+    assert all(r.success for r in results)
+    assert engine.ffmpeg.extracted == [(0, 8), (8, 16)]
+
+def test_copy_fast_sparse_segments_skip_split(engine, tmp_path):
+    """Segments covering little of the video aren't worth a full split."""
+    segments = [
+        Segment(0, 2, label="a", export_audio=False),
+        Segment(12, 14, label="b", export_audio=False),
+    ]
+    options = ProcessingOptions(codec_copy=True, output_format="mp4", export_both_formats=False)
+    
+    results = engine.process_segments_copy_fast(segments, str(tmp_path / "out"), options)
+    
+    assert all(r.success for r in results)
+    assert engine.ffmpeg.split_calls == 0
+    assert engine.ffmpeg.extracted == [(0, 2), (12, 14)]
@@ -7,6 +7,7 @@ from services.service_registry import ServiceRegistry
 from services.ai_service import AIService
 from services.audio_enhancement_service import AudioEnhancementService
 from ..components.dark_widgets import DarkLabel, DarkButton, DarkCheckbutton
+from .service_status import service_ready
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +149,8 @@ class AIFeaturesDialog(QDialog):
 
     def _generate_subtitles(self):
         """Handle subtitle generation."""
+        if not service_ready(self, self.ai_service, "Subtitle generation"):
+            return
         try:
             params = {
                 "auto_translate": self.auto_translate.isChecked(),
@@ -160,6 +163,8 @@ class AIFeaturesDialog(QDialog):
 
     def _analyze_scenes(self):
         """Handle scene analysis."""
+        if not service_ready(self, self.ai_service, "Scene analysis"):
+            return
         try:
             job_id = self.ai_service.analyze_scenes(self.video_path)
             self._show_queued_message("Scene analysis", job_id)
@@ -168,6 +173,8 @@ class AIFeaturesDialog(QDialog):
 
     def _generate_chapters(self):
         """Handle chapter generation."""
+        if not service_ready(self, self.ai_service, "Chapter generation"):
+            return
         try:
             job_id = self.ai_service.generate_chapters(self.video_path)
             self._show_queued_message("Chapter generation", job_id)
@@ -176,6 +183,8 @@ class AIFeaturesDialog(QDialog):
 
     def _process_audio(self):
         """Handle audio enhancement."""
+        if not service_ready(self, self.audio_service, "Audio enhancement"):
+            return
         try:
             params = {
                 "voice_clarity": self.voice_clarity.isChecked(),
@@ -189,6 +198,8 @@ class AIFeaturesDialog(QDialog):
 
     def _generate_highlight(self):
         """Handle highlight generation."""
+        if not service_ready(self, self.ai_service, "Highlight generation"):
+            return
         try:
             duration = self.target_duration.value()
             job_id = self.ai_service.generate_highlights(
@@ -6,6 +6,7 @@ from PyQt5.QtCore import Qt
 from services.service_registry import ServiceRegistry
 from services.audio_enhancement_service import AudioEnhancementService
 from ..components.dark_widgets import DarkLabel, DarkButton
+from .service_status import service_ready
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +121,8 @@ class AudioEnhancementDialog(QDialog):
 
     def _apply_enhancement(self):
         """Apply audio enhancement settings."""
+        if not service_ready(self, self.audio_service, "Audio enhancement"):
+            return
         try:
             params = {
                 "voice_clarity": self.voice_clarity.value() / 100.0,
@@ -350,6 +350,7 @@ class BatchDialog(QDialog):
             "Batch Processing Complete",
             f"Complete: {summary['complete']}\n"
             f"Failed: {summary['failed']}\n"
+            f"Cancelled: {summary['cancelled']}\n"
             f"Total: {summary['total']}"
         )
         
@@ -0,0 +1,23 @@
+from PyQt5.QtWidgets import QMessageBox
+
+from services.base_service import Service
+
+
+def service_ready(parent, service: Service, task: str) -> bool:
+    """Check a service before use, telling the user if it's loading or failed."""
+    if service.ready.is_set():
+        return True
+    if service.start_error is not None:
+        QMessageBox.critical(
+            parent,
+            "Unavailable",
+            f"{task} is unavailable because its service failed to start:\n\n"
+            f"{service.start_error}"
+        )
+        return False
+    QMessageBox.information(
+        parent,
+        "Still Loading",
+        f"{task} is still loading. Please try again in a moment."
+    )
+    return False
@@ -218,7 +218,10 @@ class VideoEditorApp(QMainWindow):
         self.parts_panel.segment_modified.connect(self._on_segment_modified_table)
         self.parts_panel.segment_deleted.connect(self._delete_segment)
         self.parts_panel.clear_all_requested.connect(self._clear_all_segments)
-        self.undo_manager.add_callback(self._update_undo_actions)
+        self.undo_manager.add_callback(
+            self._update_undo_actions,
+            mask=('can_undo', 'can_redo')
+        )
     
     def _apply_theme(self):
         self.setStyleSheet(PortfolioTheme.get_stylesheet())
@@ -322,7 +325,7 @@ class VideoEditorApp(QMainWindow):
     def _delete_segment(self, index):
         if 0 <= index < len(self.segments):
             segment = self.segments[index]
-            cmd = RemoveSegmentCommand(self.segments, segment)
+            cmd = RemoveSegmentCommand(self.segments, segment, index)
             self.undo_manager.execute(cmd)
             self._update_ui()
     
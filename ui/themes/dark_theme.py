@@ -43,6 +43,14 @@ class PortfolioTheme:
     
     @classmethod
     def get_stylesheet(cls):
+        # The stylesheet only depends on class constants, so build it once
+        # per theme class and hand out the same string afterwards
+        if cls.__dict__.get('_stylesheet') is None:
+            cls._stylesheet = cls._build_stylesheet()
+        return cls._stylesheet
+    
+    @classmethod
+    def _build_stylesheet(cls):
         return f"""
 /* ===== GLOBAL RESET ===== */
 * {{
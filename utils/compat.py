@@ -0,0 +1,5 @@
+"""Python version compatibility shared by the core and models packages."""
+import sys
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
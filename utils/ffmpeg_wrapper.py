@@ -1,10 +1,12 @@
 """
 Low-level FFmpeg wrapper with GPU acceleration support
 """
+import asyncio
+import csv
 import subprocess
 import json
 import os
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 
@@ -143,6 +145,58 @@ class FFmpegWrapper:
             end: End time in seconds
             options: ProcessingOptions instance with encoding settings
         """
+        cmd = self._clip_cmd(input_path, output_path, start, end, options)
+        
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, timeout=600)
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Extraction timed out (600s limit)")
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"FFmpeg failed: {e.stderr.decode()}")
+    
+    async def extract_clip_async(
+        self,
+        input_path: str,
+        output_path: str,
+        start: float,
+        end: float,
+        options = None  # ProcessingOptions
+    ) -> None:
+        """
+        Extract video clip without blocking the event loop
+        
+        Same arguments and errors as extract_clip(). Cancelling the
+        awaiting task kills the FFmpeg process.
+        """
+        cmd = self._clip_cmd(input_path, output_path, start, end, options)
+        
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=600)
+        except asyncio.TimeoutError:
+            raise RuntimeError(f"Extraction timed out (600s limit)")
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        
+        if proc.returncode:
+            raise RuntimeError(f"FFmpeg failed: {stderr.decode()}")
+    
+    def _clip_cmd(
+        self,
+        input_path: str,
+        output_path: str,
+        start: float,
+        end: float,
+        options  # ProcessingOptions
+    ) -> List[str]:
+        """Build the FFmpeg command for extract_clip()"""
         duration = end - start
         
         cmd = [
@@ -236,12 +290,78 @@ class FFmpegWrapper:
         
         cmd.append(output_path)
         
+        return cmd
+    
+    def split_copy(
+        self,
+        input_path: str,
+        output_pattern: str,
+        cut_points: List[float],
+        list_path: str,
+        options = None  # ProcessingOptions
+    ) -> List[Tuple[str, float, float]]:
+        """
+        Stream-copy the whole input into consecutive parts in one pass
+        
+        Copying can only cut on keyframes, so a part starts at the first
+        keyframe at or after its cut point, and two cut points in one GOP
+        shift every later part. Callers must go by the returned times, not
+        by part numbers.
+    
+        Args:
+            input_path: Source video file
+            output_pattern: Output pattern with a printf index, e.g. part_%04d.mp4
+            cut_points: Sorted times in seconds where a new part should start
+            list_path: Where the muxer writes its CSV list of parts
+            options: ProcessingOptions instance (metadata / extra_args only)
+        
+        Returns:
+            (path, start, end) of each part written, in order
+        """
+        cmd = [
+            self.ffmpeg_path,
+            '-y',
+            '-i', input_path,
+            # Same streams extract_clip() gets; subtitle and data streams
+            # often can't be copied into the output container
+            '-map', '0:v:0',
+            '-map', '0:a:0?',
+            '-c', 'copy',
+            '-f', 'segment',
+            '-segment_times', ','.join(str(t) for t in cut_points),
+            '-segment_list', list_path,
+            '-segment_list_type', 'csv',
+            '-reset_timestamps', '1',
+        ]
+    
+        if options is not None:
+            for key, value in options.metadata.items():
+                cmd.extend(['-metadata', f"{key}={value}"])
+    
+        cmd.extend([
+            '-avoid_negative_ts', '1',
+            '-max_muxing_queue_size', '1024'
+        ])
+    
+        if options is not None and options.extra_args:
+            cmd.extend(options.extra_args)
+    
+        cmd.append(output_pattern)
+    
         try:
             subprocess.run(cmd, check=True, capture_output=True, timeout=600)
         except subprocess.TimeoutExpired:
-            raise RuntimeError(f"Extraction timed out (600s limit)")
+            raise RuntimeError(f"Split timed out (600s limit)")
         except subprocess.CalledProcessError as e:
             raise RuntimeError(f"FFmpeg failed: {e.stderr.decode()}")
+        
+        # Each row is: file name (relative to the list), start, end
+        parts_dir = os.path.dirname(list_path)
+        with open(list_path, newline='') as f:
+            return [
+                (os.path.join(parts_dir, name), float(start), float(end))
+                for name, start, end in csv.reader(f)
+            ]
     
     def extract_audio(
         self,